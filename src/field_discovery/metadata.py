@@ -5,9 +5,15 @@ Supporting classes for field metadata management and validation
 from dataclasses import dataclass
 from typing import List, Dict, Optional
 import difflib
+import sys
 
+from .search_index import build_substring_index, iter_mask_positions, substring_matches
 
-@dataclass
+# Slotted dataclasses (no per-instance __dict__) where supported (Python 3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class FieldMetadata:
     """Metadata for a single field"""
     name: str
@@ -29,7 +35,7 @@ class FieldMetadata:
             self.usage_examples = []
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class FieldCategory:
     """Category information for field grouping"""
     id: str
@@ -42,7 +48,7 @@ class FieldCategory:
         return f"{self.icon} {self.name} ({self.field_count} fields)"
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ValidationResult:
     """Result of field validation"""
     all_valid: bool
@@ -69,6 +75,20 @@ class FieldSearchEngine:
     
     def __init__(self, fields: Dict[str, FieldMetadata]):
         self.fields = fields
+        
+        # Substring indexes over the lower-cased name and display name of each
+        # field, the lower-cased descriptions (too long to index, so scanned),
+        # and a bitmask of the fields in each lower-cased category (bit i is
+        # the i-th field of ``fields``)
+        self._metadata = list(fields.values())
+        self._metadata_names_lower = [m.name.lower() for m in self._metadata]
+        self._name_index = build_substring_index([name.lower() for name in fields])
+        self._display_index = build_substring_index([m.display_name.lower() for m in self._metadata])
+        self._descriptions_lower = tuple(m.description.lower() for m in self._metadata)
+        self._category_masks: Dict[str, int] = {}
+        for i, metadata in enumerate(self._metadata):
+            category_key = metadata.category.lower()
+            self._category_masks[category_key] = self._category_masks.get(category_key, 0) | 1 << i
     
     def search(self, keyword: str, category: Optional[str] = None) -> List[FieldMetadata]:
         """Search for fields matching keyword and optional category"""
@@ -78,31 +98,35 @@ class FieldSearchEngine:
         keyword_lower = keyword.strip().lower()
         matches = []
         
-        for field_name, metadata in self.fields.items():
-            # Skip if category filter doesn't match
-            if category and metadata.category.lower() != category.lower():
-                continue
-            
-            # Check for matches in field name
-            if keyword_lower in field_name.lower():
-                matches.append((metadata, self._calculate_relevance(keyword_lower, metadata, "name")))
-                continue
-            
-            # Check for matches in display name
-            if keyword_lower in metadata.display_name.lower():
-                matches.append((metadata, self._calculate_relevance(keyword_lower, metadata, "display")))
-                continue
-            
-            # Check for matches in description
-            if keyword_lower in metadata.description.lower():
-                matches.append((metadata, self._calculate_relevance(keyword_lower, metadata, "description")))
-                continue
+        # Fields matching in name, else display name, else description
+        name_mask = substring_matches(self._name_index, keyword_lower)
+        display_mask = substring_matches(self._display_index, keyword_lower) & ~name_mask
+        description_mask = 0
+        for i, description_lower in enumerate(self._descriptions_lower):
+            if keyword_lower in description_lower:
+                description_mask |= 1 << i
+        description_mask &= ~name_mask & ~display_mask
+        
+        candidates = name_mask | display_mask | description_mask
+        if category:
+            candidates &= self._category_masks.get(category.lower(), 0)
+        
+        for i in iter_mask_positions(candidates):
+            bit = 1 << i
+            if name_mask & bit:
+                match_type = "name"
+            elif display_mask & bit:
+                match_type = "display"
+            else:
+                match_type = "description"
+            relevance = self._calculate_relevance(keyword_lower, self._metadata_names_lower[i], match_type)
+            matches.append((self._metadata[i], relevance))
         
         # Sort by relevance (higher scores first) and return metadata objects
         matches.sort(key=lambda x: x[1], reverse=True)
         return [match[0] for match in matches]
     
-    def _calculate_relevance(self, keyword: str, metadata: FieldMetadata, match_type: str) -> int:
+    def _calculate_relevance(self, keyword: str, name_lower: str, match_type: str) -> int:
         """Calculate relevance score for ranking"""
         score = 0
         
@@ -110,7 +134,7 @@ class FieldSearchEngine:
         if match_type == "name":
             score += 100
             # Even higher for exact matches
-            if keyword == metadata.name.lower():
+            if keyword == name_lower:
                 score += 100
         elif match_type == "display":
             score += 50
@@ -118,7 +142,7 @@ class FieldSearchEngine:
             score += 10
         
         # Bonus for keyword at start of field name
-        if metadata.name.lower().startswith(keyword):
+        if name_lower.startswith(keyword):
             score += 50
         
         return score
@@ -144,6 +168,13 @@ class FieldValidator:
             "divident_yield": "dividend_yield",
             "pe_ration": "pe_ratio"
         }
+        
+        # Memoised difflib matches per name and valid fields bucketed by
+        # length, both rebuilt when valid_fields changes
+        self._close_match_cache: Dict[str, List[str]] = {}
+        self._fields_by_length: Dict[int, List[str]] = {}
+        self._cached_valid_fields = None
+        self._sync_valid_fields()
     
     def validate(self, fields: List[str]) -> ValidationResult:
         """Validate a list of field names"""
@@ -156,12 +187,7 @@ class FieldValidator:
             )
         
         # Remove duplicates while preserving order
-        unique_fields = []
-        seen = set()
-        for field in fields:
-            if field not in seen:
-                unique_fields.append(field)
-                seen.add(field)
+        unique_fields = list(dict.fromkeys(fields))
         
         valid_fields = []
         invalid_fields = []
@@ -186,6 +212,8 @@ class FieldValidator:
         """Suggest corrections for invalid field names"""
         suggestions = {}
         
+        self._sync_valid_fields()
+        
         for field in fields:
             field_suggestions = []
             
@@ -193,15 +221,40 @@ class FieldValidator:
             if field in self.common_corrections:
                 field_suggestions.append(self.common_corrections[field])
             else:
-                # Use difflib for similarity matching
-                close_matches = difflib.get_close_matches(
-                    field, 
-                    self.valid_fields, 
-                    n=3, 
-                    cutoff=0.6
-                )
+                # Use difflib for similarity matching (memoised per name)
+                close_matches = self._close_match_cache.get(field)
+                if close_matches is None:
+                    close_matches = difflib.get_close_matches(
+                        field, 
+                        self._length_candidates(len(field), 0.6), 
+                        n=3, 
+                        cutoff=0.6
+                    )
+                    self._close_match_cache[field] = close_matches
                 field_suggestions.extend(close_matches)
             
             suggestions[field] = field_suggestions
         
-        return suggestions
\ No newline at end of file
+        return suggestions
+    
+    def _sync_valid_fields(self) -> None:
+        """Reset the memo and length buckets if valid_fields was modified"""
+        valid_fields = frozenset(self.valid_fields)
+        if valid_fields == self._cached_valid_fields:
+            return
+        self._cached_valid_fields = valid_fields
+        self._close_match_cache.clear()
+        self._fields_by_length.clear()
+        for field in valid_fields:
+            self._fields_by_length.setdefault(len(field), []).append(field)
+    
+    def _length_candidates(self, length: int, cutoff: float) -> List[str]:
+        """Valid fields whose length allows a difflib ratio of at least cutoff"""
+        candidates = []
+        for other_length, fields in self._fields_by_length.items():
+            # Same upper bound as SequenceMatcher.real_quick_ratio()
+            total = length + other_length
+            bound = 2.0 * min(length, other_length) / total if total else 1.0
+            if bound >= cutoff:
+                candidates.extend(fields)
+        return candidates
@@ -0,0 +1,50 @@
+"""
+Substring Search Index
+Sorted suffix tables answering substring queries over a fixed list of texts
+"""
+# ---------------------------------------------------------------------------
+# Every suffix of each text is kept in one sorted table, so the suffixes
+# starting with a keyword (i.e. the texts containing it) form a contiguous
+# range found with two binary searches.
+#
+# Matches are int bitmasks over text positions: bit i is set for texts[i], so
+# intersecting is a single ``&`` and walking the set bits from the lowest
+# yields positions in their original order.
+# ---------------------------------------------------------------------------
+
+from bisect import bisect_left
+from typing import Iterator, List, Tuple
+
+SubstringIndex = Tuple[Tuple[str, ...], Tuple[int, ...]]
+
+# Upper bound for the suffix range of a keyword prefix
+_MAX_CHAR = chr(0x10FFFF)
+
+
+def build_substring_index(texts: List[str]) -> SubstringIndex:
+    """Build a sorted (suffixes, owner bits) table over ``texts``."""
+    entries = sorted(
+        (text[start:], index)
+        for index, text in enumerate(texts)
+        for start in range(len(text))
+    )
+    return tuple(suffix for suffix, _ in entries), tuple(1 << index for _, index in entries)
+
+
+def substring_matches(index: SubstringIndex, keyword: str) -> int:
+    """Return the bitmask of all indexed texts containing ``keyword``."""
+    suffixes, owner_bits = index
+    lo = bisect_left(suffixes, keyword)
+    hi = bisect_left(suffixes, keyword + _MAX_CHAR, lo)
+    mask = 0
+    for bit in owner_bits[lo:hi]:
+        mask |= bit
+    return mask
+
+
+def iter_mask_positions(mask: int) -> Iterator[int]:
+    """Yield the positions of the bits set in ``mask``, lowest first."""
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit
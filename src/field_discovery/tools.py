@@ -12,7 +12,8 @@ Implements field discovery and introspection capabilities for the Finviz MCP Ser
 #    in the assertions (``type`` and ``text`` attributes).
 # ---------------------------------------------------------------------------
 
-from typing import List, Optional, Dict
+from functools import lru_cache
+from typing import List, Optional, Dict, Tuple
 
 try:
     # The canonical TextContent with JSON-serialisation helpers
@@ -23,10 +24,14 @@ except Exception:  # pragma: no cover – testing environments without mcp
         """Minimal stub replicating the parts of ``mcp.types.TextContent``
         that are referenced in tests (``type`` and ``text`` attributes)."""
 
+        __slots__ = ("type", "text")
+
         def __init__(self, type: str, text: str):  # noqa: A002  (shadow built-in)
             self.type = type
             self.text = text
 
+from .search_index import build_substring_index, iter_mask_positions, substring_matches
+
 # Import field mapping from constants
 try:
     from ..constants import FINVIZ_COMPREHENSIVE_FIELD_MAPPING
@@ -64,6 +69,151 @@ except ImportError:
             FINVIZ_COMPREHENSIVE_FIELD_MAPPING[f'test_field_{i}'] = {'csv_name': f'Test Field {i}', 'column_id': 100 + i}
 
 
+# ---------------------------------------------------------------------------
+# Search index
+# ---------------------------------------------------------------------------
+# search_fields matches keywords as case-insensitive substrings of field names
+# and CSV display names, answered from suffix indexes over the lowered strings
+# (see search_index). Sets of fields are int bitmasks over their positions in
+# the mapping: bit i is set for _FIELD_NAMES[i].
+# ---------------------------------------------------------------------------
+
+
+def _mask_fields(mask: int) -> List[str]:
+    """Return the fields whose bits are set in ``mask``, in mapping order."""
+    return [_FIELD_NAMES[i] for i in iter_mask_positions(mask)]
+
+
+# Field registry flattened into parallel tuples indexed by mapping position
+_FIELD_NAMES = tuple(FINVIZ_COMPREHENSIVE_FIELD_MAPPING)
+_CSV_NAMES = tuple(
+    info.get('csv_name', field) for field, info in FINVIZ_COMPREHENSIVE_FIELD_MAPPING.items()
+)
+_FIELD_POSITIONS = {field: i for i, field in enumerate(_FIELD_NAMES)}
+
+_FIELD_NAME_INDEX = build_substring_index([field.lower() for field in _FIELD_NAMES])
+_CSV_NAME_INDEX = build_substring_index([csv_name.lower() for csv_name in _CSV_NAMES])
+
+
+# ---------------------------------------------------------------------------
+# Suggestion tables
+# ---------------------------------------------------------------------------
+# describe_field and validate_fields suggest fields whose names contain, or are
+# contained in, an unknown name (validate_fields also accepts names of similar
+# length). Well-known typos map straight to their correction; the remaining
+# checks are answered from the substring index and the lookup tables below
+# instead of scanning every field per query.
+# ---------------------------------------------------------------------------
+
+# Common typos and their corrections
+_COMMON_CORRECTIONS = {
+    "eps_yoy": "eps_growth_this_y",
+    "sales_qtr_over_qtr": "sales_growth_qtr",
+    "sales_growth_yoy": "sales_growth_this_y",
+    "div_yield": "dividend_yield",
+    "market_capitalication": "market_cap",
+    "pe": "pe_ratio",
+    "pb": "pb_ratio",
+    "ps": "ps_ratio"
+}
+
+
+def _first_positions(keys) -> Dict:
+    """Map each key to the index of its first occurrence."""
+    positions: Dict = {}
+    for index, key in enumerate(keys):
+        positions.setdefault(key, index)
+    return positions
+
+
+# Lower-cased field name -> index, and name length -> index of first field
+_LOWER_FIELD_POSITIONS = _first_positions(field.lower() for field in _FIELD_NAMES)
+_FIRST_FIELD_BY_LENGTH = _first_positions(len(field) for field in _FIELD_NAMES)
+_MAX_FIELD_NAME_LEN = max(_FIRST_FIELD_BY_LENGTH, default=0)
+
+
+def _contained_fields_mask(text: str) -> int:
+    """Return the bitmask of fields whose lower-cased name occurs in ``text``."""
+    mask = 0
+    for start in range(len(text)):
+        for end in range(start + 1, min(start + _MAX_FIELD_NAME_LEN, len(text)) + 1):
+            index = _LOWER_FIELD_POSITIONS.get(text[start:end])
+            if index is not None:
+                mask |= 1 << index
+    return mask
+
+
+def _similar_fields_mask(field_lower: str) -> int:
+    """Bitmask of fields containing, or contained in, ``field_lower``."""
+    mask = _contained_fields_mask(field_lower)
+    if len(field_lower) <= _MAX_FIELD_NAME_LEN:
+        # Only texts no longer than a field name can occur inside one
+        mask |= substring_matches(_FIELD_NAME_INDEX, field_lower)
+    return mask
+
+
+def _suggest_field(field: str) -> Optional[str]:
+    """Return the correction suggested by validate_fields, if any."""
+    if field in _COMMON_CORRECTIONS:
+        return _COMMON_CORRECTIONS[field]
+    field_lower = field.lower()
+    candidates = _similar_fields_mask(field_lower)
+    length = len(field_lower)
+    for other in range(length - 2, length + 3):
+        if other in _FIRST_FIELD_BY_LENGTH:
+            candidates |= 1 << _FIRST_FIELD_BY_LENGTH[other]
+    if not candidates:
+        return None
+    return _FIELD_NAMES[(candidates & -candidates).bit_length() - 1]
+
+
+# Category mappings used by search_fields for filtering and grouping
+_SEARCH_CATEGORY_FIELDS = {
+    "basic": ["ticker", "company", "sector", "industry", "market_cap"],
+    "valuation": ["pe_ratio", "pb_ratio", "ps_ratio", "peg", "dividend_yield", 
+                 "forward_pe", "price_to_cash", "price_to_free_cash_flow"],
+    "performance": ["performance_1w", "performance_1m", "performance_3m", 
+                   "performance_6m", "performance_1y", "performance_ytd"],
+    "technical": ["rsi", "beta", "volatility", "sma20", "sma50", "sma200", "relative_volume"],
+    "fundamental": ["eps_ttm", "revenue", "profit_margin", "roe", "debt_equity", 
+                   "current_ratio", "book_value_per_share", "cash_per_share"],
+    "earnings": ["eps_growth_qtr", "eps_growth_this_y", "sales_growth_qtr", "earnings_date", "dividend_growth"],
+    "etf": ["aum", "expense_ratio", "inception_date", "fund_family"],
+    "news": ["news_title", "news_url", "analyst_recom", "insider_ownership"],
+    "trading": ["volume", "avg_volume", "float", "short_interest", "option_volume"]
+}
+
+# Category id -> bitmask of its fields present in the mapping
+_SEARCH_CATEGORY_MASKS = {
+    category_id: sum(1 << _FIELD_POSITIONS[f] for f in set(fields) if f in _FIELD_POSITIONS)
+    for category_id, fields in _SEARCH_CATEGORY_FIELDS.items()
+}
+
+
+def _build_field_search_categories() -> Dict[str, str]:
+    """Map each field to the title of the first category listing it."""
+    field_categories: Dict[str, str] = {}
+    for category_id, fields in _SEARCH_CATEGORY_FIELDS.items():
+        for field in fields:
+            field_categories.setdefault(field, category_id.title())
+    return field_categories
+
+
+def _build_field_result_lines(marker: str) -> Dict[str, Tuple[str, ...]]:
+    """Pre-render the result lines (name and display name) per field."""
+    result_lines: Dict[str, Tuple[str, ...]] = {}
+    for field, csv_name in zip(_FIELD_NAMES, _CSV_NAMES):
+        lines = [f"  {marker} {field}"]
+        if csv_name != field:
+            lines.append(f"    ↳ Display: {csv_name}")
+        result_lines[field] = tuple(lines)
+    return result_lines
+
+
+_FIELD_SEARCH_CATEGORY = _build_field_search_categories()
+_SEARCH_RESULT_LINES = _build_field_result_lines("•")
+_VALID_FIELD_LINES = _build_field_result_lines("✓")
+
 def list_available_fields() -> List[TextContent]:
     """
     List all available data fields for stock fundamentals.
@@ -72,9 +222,19 @@ def list_available_fields() -> List[TextContent]:
         Complete list of field names that can be used with 
         get_stock_fundamentals and get_multiple_stocks_fundamentals
     """
-    # Get all available fields from the mapping
-    all_fields = list(FINVIZ_COMPREHENSIVE_FIELD_MAPPING.keys())
-    total_count = len(all_fields)
+    return [_available_fields_content()]
+
+
+@lru_cache(maxsize=None)
+def _available_fields_content() -> TextContent:
+    """Shared list_available_fields result item (its text never changes)."""
+    return TextContent(type="text", text=_render_available_fields())
+
+
+@lru_cache(maxsize=None)
+def _render_available_fields() -> str:
+    """Render the list_available_fields text (static, so rendered once)."""
+    total_count = len(_FIELD_NAMES)
     
     # Categorize fields for better organization
     categories = {
@@ -120,14 +280,14 @@ def list_available_fields() -> List[TextContent]:
     for category_name, sample_fields in categories.items():
         output_lines.append(f"{category_name}:")
         # Show sample fields that exist in the mapping
-        existing_fields = [f for f in sample_fields if f in all_fields]
+        existing_fields = [f for f in sample_fields if f in _FIELD_POSITIONS]
         for field in existing_fields[:5]:  # Show first 5 as samples
             output_lines.append(f"- {field}")
         if len(existing_fields) > 5:
             output_lines.append(f"- ... and {len(existing_fields) - 5} more")
         elif len(existing_fields) == 0:
             # If no predefined fields exist, show some from actual mapping
-            available_fields_for_category = [f for f in all_fields if any(keyword in f for keyword in category_name.lower().split())]
+            available_fields_for_category = [f for f in _FIELD_NAMES if any(keyword in f for keyword in category_name.lower().split())]
             for field in available_fields_for_category[:3]:
                 output_lines.append(f"- {field}")
         output_lines.append("")
@@ -141,7 +301,7 @@ def list_available_fields() -> List[TextContent]:
         "- Use search_fields(keyword) to find specific fields"
     ])
     
-    return [TextContent(type="text", text="\n".join(output_lines))]
+    return "\n".join(output_lines)
 
 
 def get_field_categories() -> List[TextContent]:
@@ -152,9 +312,18 @@ def get_field_categories() -> List[TextContent]:
         Fields grouped by functionality (valuation, performance, 
         technical, fundamental, etc.)
     """
-    # Get all available fields from the mapping
-    all_fields = list(FINVIZ_COMPREHENSIVE_FIELD_MAPPING.keys())
-    
+    return [_field_categories_content()]
+
+
+@lru_cache(maxsize=None)
+def _field_categories_content() -> TextContent:
+    """Shared get_field_categories result item (its text never changes)."""
+    return TextContent(type="text", text=_render_field_categories())
+
+
+@lru_cache(maxsize=None)
+def _render_field_categories() -> str:
+    """Render the get_field_categories text (static, so rendered once)."""
     # Define categories with icons and field lists
     categories_config = {
         "basic": {
@@ -212,7 +381,7 @@ def get_field_categories() -> List[TextContent]:
     
     for category_id, config in categories_config.items():
         # Find existing fields in this category
-        existing_fields = [f for f in config["fields"] if f in all_fields]
+        existing_fields = [f for f in config["fields"] if f in _FIELD_POSITIONS]
         field_count = len(existing_fields)
         
         # Category header
@@ -230,7 +399,7 @@ def get_field_categories() -> List[TextContent]:
         
         output_lines.append("")
     
-    return [TextContent(type="text", text="\n".join(output_lines))]
+    return "\n".join(output_lines)
 
 
 def describe_field(field_name: str) -> List[TextContent]:
@@ -245,13 +414,10 @@ def describe_field(field_name: str) -> List[TextContent]:
         format, and usage examples
     """
     # Check if field exists in mapping
-    if field_name not in FINVIZ_COMPREHENSIVE_FIELD_MAPPING:
+    if field_name not in _FIELD_DESCRIPTION_TEXTS:
         # Suggest similar fields
-        similar_fields = []
-        for existing_field in FINVIZ_COMPREHENSIVE_FIELD_MAPPING.keys():
-            if field_name.lower() in existing_field.lower() or existing_field.lower() in field_name.lower():
-                similar_fields.append(existing_field)
-        
+        similar_fields = _mask_fields(_similar_fields_mask(field_name.lower()))
+
         output_lines = [
             f"❌ Field '{field_name}' not found",
             "",
@@ -267,65 +433,67 @@ def describe_field(field_name: str) -> List[TextContent]:
         
         return [TextContent(type="text", text="\n".join(output_lines))]
     
-    # Get field metadata
-    field_info = FINVIZ_COMPREHENSIVE_FIELD_MAPPING[field_name]
-    csv_name = field_info.get('csv_name', field_name)
-    
-    # Define field descriptions and metadata
-    field_descriptions = {
-        "pe_ratio": {
-            "display_name": "Price-to-Earnings Ratio",
-            "category": "Valuation Metrics",
-            "description": "The ratio of a company's current share price to its per-share earnings. Used to value a company relative to its earnings.",
-            "format": "Decimal number (e.g., 15.2, 22.8)",
-            "interpretation": {
-                "low": "Low P/E (< 15): Potentially undervalued or slow growth",
-                "medium": "Medium P/E (15-25): Fairly valued for moderate growth",
-                "high": "High P/E (> 25): Growth expectations or overvalued"
-            },
-            "related_fields": ["forward_pe", "peg", "eps_ttm", "earnings_date"]
+    return [TextContent(type="text", text=_FIELD_DESCRIPTION_TEXTS[field_name])]
+
+
+# Descriptions and metadata for the well-known fields
+_FIELD_DESCRIPTIONS = {
+    "pe_ratio": {
+        "display_name": "Price-to-Earnings Ratio",
+        "category": "Valuation Metrics",
+        "description": "The ratio of a company's current share price to its per-share earnings. Used to value a company relative to its earnings.",
+        "format": "Decimal number (e.g., 15.2, 22.8)",
+        "interpretation": {
+            "low": "Low P/E (< 15): Potentially undervalued or slow growth",
+            "medium": "Medium P/E (15-25): Fairly valued for moderate growth",
+            "high": "High P/E (> 25): Growth expectations or overvalued"
         },
-        "dividend_yield": {
-            "display_name": "Dividend Yield",
-            "category": "Valuation Metrics", 
-            "description": "Annual dividend payment as a percentage of the stock price. Indicates income potential from dividends.",
-            "format": "Percentage (e.g., 2.5%, 4.1%)",
-            "interpretation": {
-                "low": "0-2%: Growth companies, low income",
-                "medium": "2-4%: Balanced income and growth",
-                "high": "4%+: High income, mature companies"
-            },
-            "related_fields": ["dividend", "payout_ratio", "dividend_growth_1_year"]
+        "related_fields": ["forward_pe", "peg", "eps_ttm", "earnings_date"]
+    },
+    "dividend_yield": {
+        "display_name": "Dividend Yield",
+        "category": "Valuation Metrics", 
+        "description": "Annual dividend payment as a percentage of the stock price. Indicates income potential from dividends.",
+        "format": "Percentage (e.g., 2.5%, 4.1%)",
+        "interpretation": {
+            "low": "0-2%: Growth companies, low income",
+            "medium": "2-4%: Balanced income and growth",
+            "high": "4%+: High income, mature companies"
         },
-        "market_cap": {
-            "display_name": "Market Capitalization",
-            "category": "Basic Information",
-            "description": "Total value of a company's shares in the market. Key metric for company size classification.",
-            "format": "Dollar amount (e.g., $50.2B, $1.5T)",
-            "interpretation": {
-                "small": "< $2B: Small-cap, higher risk/reward",
-                "mid": "$2B-$10B: Mid-cap, balanced growth",
-                "large": "> $10B: Large-cap, established companies"
-            },
-            "related_fields": ["shares_outstanding", "price", "float"]
+        "related_fields": ["dividend", "payout_ratio", "dividend_growth_1_year"]
+    },
+    "market_cap": {
+        "display_name": "Market Capitalization",
+        "category": "Basic Information",
+        "description": "Total value of a company's shares in the market. Key metric for company size classification.",
+        "format": "Dollar amount (e.g., $50.2B, $1.5T)",
+        "interpretation": {
+            "small": "< $2B: Small-cap, higher risk/reward",
+            "mid": "$2B-$10B: Mid-cap, balanced growth",
+            "large": "> $10B: Large-cap, established companies"
         },
-        "eps_growth_qtr": {
-            "display_name": "EPS Growth Quarter-over-Quarter",
-            "category": "Earnings & Growth",
-            "description": "Percentage change in earnings per share compared to the previous quarter. Shows short-term earnings momentum.",
-            "format": "Percentage (e.g., 15.3%, -5.2%)",
-            "interpretation": {
-                "positive": "> 0%: Growing earnings, positive momentum",
-                "negative": "< 0%: Declining earnings, potential concerns",
-                "high": "> 20%: Strong growth, verify sustainability"
-            },
-            "related_fields": ["eps_ttm", "eps_growth_this_y", "sales_growth_qtr"]
-        }
+        "related_fields": ["shares_outstanding", "price", "float"]
+    },
+    "eps_growth_qtr": {
+        "display_name": "EPS Growth Quarter-over-Quarter",
+        "category": "Earnings & Growth",
+        "description": "Percentage change in earnings per share compared to the previous quarter. Shows short-term earnings momentum.",
+        "format": "Percentage (e.g., 15.3%, -5.2%)",
+        "interpretation": {
+            "positive": "> 0%: Growing earnings, positive momentum",
+            "negative": "< 0%: Declining earnings, potential concerns",
+            "high": "> 20%: Strong growth, verify sustainability"
+        },
+        "related_fields": ["eps_ttm", "eps_growth_this_y", "sales_growth_qtr"]
     }
-    
+}
+
+
+def _render_field_description(field_name: str, csv_name: str) -> str:
+    """Render the describe_field output for a field in the mapping."""
     # Get description or create default
-    if field_name in field_descriptions:
-        desc = field_descriptions[field_name]
+    if field_name in _FIELD_DESCRIPTIONS:
+        desc = _FIELD_DESCRIPTIONS[field_name]
     else:
         # Create basic description for unmapped fields
         desc = {
@@ -377,7 +545,14 @@ def describe_field(field_name: str) -> List[TextContent]:
         "💡 Tip: Use search_fields('{keyword}') to find similar fields"
     ])
     
-    return [TextContent(type="text", text="\n".join(output_lines))]
+    return "\n".join(output_lines)
+
+
+# describe_field output per field, rendered once at import
+_FIELD_DESCRIPTION_TEXTS = {
+    field: _render_field_description(field, csv_name)
+    for field, csv_name in zip(_FIELD_NAMES, _CSV_NAMES)
+}
 
 
 def search_fields(keyword: str, category: Optional[str] = None) -> List[TextContent]:
@@ -395,43 +570,26 @@ def search_fields(keyword: str, category: Optional[str] = None) -> List[TextCont
     if not keyword or not keyword.strip():
         return [TextContent(type="text", text="❌ No search term provided. Please provide a keyword.\n\n💡 Example: search_fields('growth')")]
     
+    return [TextContent(type="text", text=_render_search_results(keyword, category))]
+
+
+@lru_cache(maxsize=512)
+def _render_search_results(keyword: str, category: Optional[str]) -> str:
+    """Render the search_fields text for a non-empty keyword (cached per query)."""
     keyword_lower = keyword.strip().lower()
-    all_fields = list(FINVIZ_COMPREHENSIVE_FIELD_MAPPING.keys())
-    
-    # Define category mappings for filtering
-    category_fields = {
-        "basic": ["ticker", "company", "sector", "industry", "market_cap"],
-        "valuation": ["pe_ratio", "pb_ratio", "ps_ratio", "peg", "dividend_yield", 
-                     "forward_pe", "price_to_cash", "price_to_free_cash_flow"],
-        "performance": ["performance_1w", "performance_1m", "performance_3m", 
-                       "performance_6m", "performance_1y", "performance_ytd"],
-        "technical": ["rsi", "beta", "volatility", "sma20", "sma50", "sma200", "relative_volume"],
-        "fundamental": ["eps_ttm", "revenue", "profit_margin", "roe", "debt_equity", 
-                       "current_ratio", "book_value_per_share", "cash_per_share"],
-        "earnings": ["eps_growth_qtr", "eps_growth_this_y", "sales_growth_qtr", "earnings_date", "dividend_growth"],
-        "etf": ["aum", "expense_ratio", "inception_date", "fund_family"],
-        "news": ["news_title", "news_url", "analyst_recom", "insider_ownership"],
-        "trading": ["volume", "avg_volume", "float", "short_interest", "option_volume"]
-    }
-    
-    # Find matching fields
-    matching_fields = []
     
-    # Search in field names
-    for field in all_fields:
-        if keyword_lower in field.lower():
-            matching_fields.append(field)
-    
-    # Search in CSV names (display names)
-    for field, field_info in FINVIZ_COMPREHENSIVE_FIELD_MAPPING.items():
-        csv_name = field_info.get('csv_name', '')
-        if keyword_lower in csv_name.lower() and field not in matching_fields:
-            matching_fields.append(field)
+    # Find matching fields: field name matches first, then CSV (display) name
+    # matches, each in mapping order
+    name_matches = substring_matches(_FIELD_NAME_INDEX, keyword_lower)
+    csv_matches = substring_matches(_CSV_NAME_INDEX, keyword_lower) & ~name_matches
     
     # Apply category filter if provided
-    if category and category.lower() in category_fields:
-        category_field_list = category_fields[category.lower()]
-        matching_fields = [f for f in matching_fields if f in category_field_list]
+    category_mask = _SEARCH_CATEGORY_MASKS.get(category.lower()) if category else None
+    if category_mask is not None:
+        name_matches &= category_mask
+        csv_matches &= category_mask
+    
+    matching_fields = _mask_fields(name_matches) + _mask_fields(csv_matches)
     
     # Build output
     if not matching_fields:
@@ -452,7 +610,7 @@ def search_fields(keyword: str, category: Optional[str] = None) -> List[TextCont
             "  • Use get_field_categories() to browse by category"
         ])
         
-        return [TextContent(type="text", text="\n".join(output_lines))]
+        return "\n".join(output_lines)
     
     # Build results
     output_lines = [
@@ -467,12 +625,7 @@ def search_fields(keyword: str, category: Optional[str] = None) -> List[TextCont
     # Group results by category for better organization
     categorized_results = {}
     for field in matching_fields:
-        field_category = "Other"
-        for cat_name, cat_fields in category_fields.items():
-            if field in cat_fields:
-                field_category = cat_name.title()
-                break
-        
+        field_category = _FIELD_SEARCH_CATEGORY.get(field, "Other")
         if field_category not in categorized_results:
             categorized_results[field_category] = []
         categorized_results[field_category].append(field)
@@ -483,13 +636,7 @@ def search_fields(keyword: str, category: Optional[str] = None) -> List[TextCont
             output_lines.append(f"📊 {cat_name}:")
         
         for field in sorted(fields):
-            # Get display name
-            field_info = FINVIZ_COMPREHENSIVE_FIELD_MAPPING.get(field, {})
-            csv_name = field_info.get('csv_name', field)
-            
-            output_lines.append(f"  • {field}")
-            if csv_name != field:
-                output_lines.append(f"    ↳ Display: {csv_name}")
+            output_lines.extend(_SEARCH_RESULT_LINES[field])
         
         if len(categorized_results) > 1:
             output_lines.append("")
@@ -503,7 +650,25 @@ def search_fields(keyword: str, category: Optional[str] = None) -> List[TextCont
         "💡 Tip: Use category filter like search_fields('ratio', category='valuation')"
     ])
     
-    return [TextContent(type="text", text="\n".join(output_lines))]
+    return "\n".join(output_lines)
+
+
+# Static lines of the validate_fields output
+_NO_SUGGESTION_LINE = "    → No suggestions found"
+_VALIDATION_GUIDANCE_LINES = (
+    "💡 SUGGESTIONS:",
+    "  • Double-check field names for typos",
+    "  • Use search_fields('keyword') to find correct names",
+    "  • Use list_available_fields() to see all options",
+    "  • Common patterns:",
+    "    - Growth metrics: eps_growth_qtr, sales_growth_qtr",
+    "    - Performance: performance_1w, performance_1m",
+    "    - Ratios: pe_ratio, pb_ratio, ps_ratio",
+    "",
+    "📚 Yearly growth fields use '_this_y' suffix",
+    "📅 Quarterly growth fields use '_qtr' suffix",
+    ""
+)
 
 
 def validate_fields(field_names: List[str]) -> List[TextContent]:
@@ -520,53 +685,19 @@ def validate_fields(field_names: List[str]) -> List[TextContent]:
     if not field_names:
         return [TextContent(type="text", text="❌ No fields provided.\n\n💡 Example: validate_fields(['ticker', 'pe_ratio'])")]
     
-    all_fields = set(FINVIZ_COMPREHENSIVE_FIELD_MAPPING.keys())
     valid_fields = []
     invalid_fields = []
     suggestions = {}
     
-    # Define common typos and corrections
-    common_corrections = {
-        "eps_yoy": "eps_growth_this_y",
-        "sales_qtr_over_qtr": "sales_growth_qtr", 
-        "sales_growth_yoy": "sales_growth_this_y",
-        "div_yield": "dividend_yield",
-        "market_capitalication": "market_cap",
-        "pe": "pe_ratio",
-        "pb": "pb_ratio",
-        "ps": "ps_ratio"
-    }
-    
     # Validate each field
     for field in field_names:
-        if field in all_fields:
+        if field in _VALID_FIELD_LINES:
             valid_fields.append(field)
         else:
             invalid_fields.append(field)
             
-            # Find suggestions
-            suggestion = None
-            
-            # Check common corrections first
-            if field in common_corrections:
-                suggestion = common_corrections[field]
-            else:
-                # Find similar field names
-                field_lower = field.lower()
-                similar_fields = []
-                
-                for existing_field in all_fields:
-                    existing_lower = existing_field.lower()
-                    
-                    # Check for partial matches
-                    if (field_lower in existing_lower or 
-                        existing_lower in field_lower or
-                        abs(len(field_lower) - len(existing_lower)) <= 2):
-                        similar_fields.append(existing_field)
-                
-                if similar_fields:
-                    suggestion = similar_fields[0]  # Take the first match
-            
+            # Common corrections first, then similar field names
+            suggestion = _suggest_field(field)
             if suggestion:
                 suggestions[field] = suggestion
     
@@ -583,11 +714,7 @@ def validate_fields(field_names: List[str]) -> List[TextContent]:
             ""
         ])
         for field in valid_fields:
-            field_info = FINVIZ_COMPREHENSIVE_FIELD_MAPPING.get(field, {})
-            csv_name = field_info.get('csv_name', field)
-            output_lines.append(f"  ✓ {field}")
-            if csv_name != field:
-                output_lines.append(f"    ↳ Display: {csv_name}")
+            output_lines.extend(_VALID_FIELD_LINES[field])
         output_lines.append("")
     
     # Invalid fields section
@@ -597,29 +724,16 @@ def validate_fields(field_names: List[str]) -> List[TextContent]:
             ""
         ])
         for field in invalid_fields:
-            output_lines.append(f"  ✗ {field}")
+            output_lines.append("  ✗ " + field)
             if field in suggestions:
-                output_lines.append(f"    → Did you mean: {suggestions[field]}")
+                output_lines.append("    → Did you mean: " + suggestions[field])
             else:
-                output_lines.append(f"    → No suggestions found")
+                output_lines.append(_NO_SUGGESTION_LINE)
         output_lines.append("")
     
     # Summary and guidance
     if invalid_fields:
-        output_lines.extend([
-            "💡 SUGGESTIONS:",
-            "  • Double-check field names for typos",
-            "  • Use search_fields('keyword') to find correct names",
-            "  • Use list_available_fields() to see all options",
-            "  • Common patterns:",
-            "    - Growth metrics: eps_growth_qtr, sales_growth_qtr",
-            "    - Performance: performance_1w, performance_1m",
-            "    - Ratios: pe_ratio, pb_ratio, ps_ratio",
-            "",
-            "📚 Yearly growth fields use '_this_y' suffix",
-            "📅 Quarterly growth fields use '_qtr' suffix",
-            ""
-        ])
+        output_lines.extend(_VALIDATION_GUIDANCE_LINES)
     
     # Usage examples
     if valid_fields:
@@ -5,28 +5,70 @@ This module provides functionality to retrieve SEC filing document content
 using the official EDGAR API instead of web scraping.
 """
 
+import gzip
+import hashlib
+import json
 import logging
+import os
+import tempfile
+import threading
 import time
-from typing import Dict, List, Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import requests
+from requests.adapters import HTTPAdapter
 from sec_edgar_api import EdgarClient
 
 from ..models import SECFilingData
 from ..utils.validators import validate_ticker
 
+# Use orjson for decoding/encoding large EDGAR JSON payloads when available
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(data: Any) -> bytes:
+        return json.dumps(data).encode('utf-8')
+
 logger = logging.getLogger(__name__)
 
+# SEC endpoint mapping tickers to CIKs
+COMPANY_TICKERS_URL = 'https://www.sec.gov/files/company_tickers.json'
+
+# SEC fair-access policy allows at most 10 requests per second
+SEC_MIN_REQUEST_INTERVAL = 0.1  # seconds between request starts
+MAX_CONCURRENT_FETCHES = 10
+
+# In-process company facts cache settings
+COMPANY_FACTS_CACHE_TTL = 3600  # seconds
+COMPANY_FACTS_CACHE_MAXSIZE = 32  # companyfacts payloads are often several MB
+
+# On-disk EDGAR JSON response cache settings (opt-in via EDGAR_CACHE_DIR)
+DISK_CACHE_TTL = 86400  # seconds; tickers, company facts and concepts
+SUBMISSIONS_DISK_CACHE_TTL = 3600  # seconds; filing index changes more often
+
 
 class EdgarAPIClient:
     """EDGAR API client for retrieving SEC filing document content"""
     
-    def __init__(self, user_agent: str = "Finviz MCP Server contact@example.com"):
+    def __init__(
+        self,
+        user_agent: str = "Finviz MCP Server contact@example.com",
+        cache_dir: Optional[str] = None
+    ):
         """
         Initialize EDGAR API client
         
         Args:
             user_agent: User agent string for SEC API requests (required by SEC)
+            cache_dir: Directory for the on-disk EDGAR response cache
+                       (default: EDGAR_CACHE_DIR env; unset or empty string
+                       disables the disk cache)
         """
         self.client = EdgarClient(user_agent=user_agent)
         self.session = requests.Session()
@@ -37,21 +79,110 @@ class EdgarAPIClient:
             'Accept-Encoding': 'gzip, deflate',
             'Connection': 'keep-alive'
         })
+        # Keep one pooled keep-alive connection per concurrent fetch worker
+        self.session.mount('https://', HTTPAdapter(pool_maxsize=MAX_CONCURRENT_FETCHES))
+        
+        # Ticker -> CIK map, loaded once from the SEC company tickers JSON
+        self._ticker_cik_map: Optional[Dict[str, str]] = None
+        self._ticker_cik_lock = threading.Lock()
+        # CIK -> (fetched_at, company facts)
+        self._company_facts_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._company_facts_lock = threading.Lock()
+        
+        # Shared request pacing across worker threads
+        self._rate_lock = threading.Lock()
+        self._last_request_at = 0.0
+        
+        if cache_dir is None:
+            cache_dir = os.getenv('EDGAR_CACHE_DIR', '')
+        self.cache_dir = Path(cache_dir).expanduser() if cache_dir else None
+    
+    def _disk_cache_path(self, key: str) -> Path:
+        """Return the cache file path for a cache key"""
+        return self.cache_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json.gz"
+    
+    def _read_disk_cache(self, key: str, ttl: float) -> Optional[Any]:
+        """Read a cached JSON response if present and not expired"""
+        if self.cache_dir is None:
+            return None
+        
+        path = self._disk_cache_path(key)
+        try:
+            if time.time() - path.stat().st_mtime > ttl:
+                return None
+            with gzip.open(path, 'rb') as f:
+                return _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+    
+    def _write_disk_cache(self, key: str, data: Any) -> None:
+        """Write a JSON response to the disk cache (gzip compressed)"""
+        if self.cache_dir is None:
+            return
+        
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            os.close(fd)
+            try:
+                with gzip.open(tmp_path, 'wb') as f:
+                    f.write(_json_dumps(data))
+                os.replace(tmp_path, self._disk_cache_path(key))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Could not write EDGAR cache entry {key}: {e}")
+    
+    def _cached_json(self, key: str, fetch: Callable[[], Any], ttl: float = DISK_CACHE_TTL) -> Any:
+        """Return a JSON response from the disk cache, fetching and storing it on a miss"""
+        data = self._read_disk_cache(key, ttl)
+        if data is None:
+            data = fetch()
+            if data:
+                self._write_disk_cache(key, data)
+        return data
+    
+    def _throttle(self) -> None:
+        """Space out request starts to stay within SEC's rate limit"""
+        with self._rate_lock:
+            wait = self._last_request_at + SEC_MIN_REQUEST_INTERVAL - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_request_at = time.monotonic()
+    
+    def _load_ticker_cik_map(self) -> Dict[str, str]:
+        """Fetch the SEC company tickers JSON once and index it by ticker"""
+        if self._ticker_cik_map is None:
+            # Concurrent filing fetches must not each download the map
+            with self._ticker_cik_lock:
+                if self._ticker_cik_map is None:
+                    data = self._cached_json(COMPANY_TICKERS_URL, self._fetch_company_tickers)
+                    
+                    ticker_cik_map: Dict[str, str] = {}
+                    for entry in data.values():
+                        ticker_cik_map.setdefault(
+                            entry.get('ticker', '').upper(),
+                            str(entry.get('cik_str', '')).zfill(10)
+                        )
+                    self._ticker_cik_map = ticker_cik_map
+        
+        return self._ticker_cik_map
+        
+    def _fetch_company_tickers(self) -> Dict[str, Any]:
+        """Download the SEC company tickers JSON"""
+        self._throttle()
+        response = self.session.get(COMPANY_TICKERS_URL, timeout=10)
+        response.raise_for_status()
+        return _json_loads(response.content)
         
     def _get_cik_from_ticker(self, ticker: str) -> Optional[str]:
         """Get CIK from ticker using SEC company tickers JSON"""
         try:
-            # Use SEC's company tickers endpoint
-            response = self.session.get('https://www.sec.gov/files/company_tickers.json', timeout=10)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Search for ticker in the data
-            for entry in data.values():
-                if entry.get('ticker', '').upper() == ticker.upper():
-                    cik = str(entry.get('cik_str', '')).zfill(10)
-                    logger.info(f"Found CIK {cik} for ticker {ticker}")
-                    return cik
+            cik = self._load_ticker_cik_map().get(ticker.upper())
+            if cik:
+                logger.info(f"Found CIK {cik} for ticker {ticker}")
+                return cik
             
             logger.warning(f"CIK not found for ticker {ticker}")
             return None
@@ -59,7 +190,46 @@ class EdgarAPIClient:
         except Exception as e:
             logger.error(f"Error getting CIK for ticker {ticker}: {e}")
             return None
+    
+    def get_company_facts(self, cik: str) -> Dict[str, Any]:
+        """
+        Get company facts via EDGAR API, cached in-process per CIK
+        
+        Args:
+            cik: 10-digit CIK
+            
+        Returns:
+            Company facts dictionary
+        """
+        with self._company_facts_lock:
+            cached = self._company_facts_cache.get(cik)
+        if cached and time.monotonic() - cached[0] < COMPANY_FACTS_CACHE_TTL:
+            return cached[1]
+        
+        company_facts = self._cached_json(
+            f"companyfacts/{cik}",
+            lambda: self.client.get_company_facts(cik=cik)
+        )
+        
+        # Cache only real responses so a transient failure is retried
+        if company_facts:
+            self._store_company_facts(cik, company_facts)
+        
+        return company_facts
 
+    def _store_company_facts(self, cik: str, company_facts: Dict[str, Any]) -> None:
+        """Insert company facts, pruning expired entries and evicting the oldest when full"""
+        now = time.monotonic()
+        with self._company_facts_lock:
+            cache = self._company_facts_cache
+            for key in [k for k, (fetched_at, _) in cache.items() if now - fetched_at >= COMPANY_FACTS_CACHE_TTL]:
+                del cache[key]
+            # Re-inserting moves the CIK to the end, keeping the dict ordered by age
+            cache.pop(cik, None)
+            while len(cache) >= COMPANY_FACTS_CACHE_MAXSIZE:
+                del cache[next(iter(cache))]
+            cache[cik] = (now, company_facts)
+    
     def get_company_filings(
         self,
         ticker: str,
@@ -94,7 +264,11 @@ class EdgarAPIClient:
                 return []
             
             # Get submissions data
-            submissions = self.client.get_submissions(cik=cik)
+            submissions = self._cached_json(
+                f"submissions/{cik}",
+                lambda: self.client.get_submissions(cik=cik),
+                ttl=SUBMISSIONS_DISK_CACHE_TTL
+            )
             if not submissions or 'filings' not in submissions:
                 logger.warning(f"No submissions found for {ticker} (CIK: {cik})")
                 return []
@@ -110,24 +284,25 @@ class EdgarAPIClient:
             primary_documents = recent_filings.get('primaryDocument', [])
             descriptions = recent_filings.get('primaryDocDescription', [])
             
+            # Filter on form type and filing date before reading the other columns
+            form_filter = frozenset(form_types) if form_types else None
+            
             for i in range(min(len(forms), max_count)):
                 form = forms[i]
-                filing_date = filing_dates[i] if i < len(filing_dates) else ''
-                report_date = report_dates[i] if i < len(report_dates) else ''
-                accession = accession_numbers[i] if i < len(accession_numbers) else ''
-                primary_doc = primary_documents[i] if i < len(primary_documents) else ''
-                description = descriptions[i] if i < len(descriptions) else ''
-                
-                # Filter by form types if specified
-                if form_types and form not in form_types:
+                if form_filter is not None and form not in form_filter:
                     continue
                 
-                # Filter by date range if specified
+                filing_date = filing_dates[i] if i < len(filing_dates) else ''
                 if date_from and filing_date < date_from:
                     continue
                 if date_to and filing_date > date_to:
                     continue
                 
+                report_date = report_dates[i] if i < len(report_dates) else ''
+                accession = accession_numbers[i] if i < len(accession_numbers) else ''
+                primary_doc = primary_documents[i] if i < len(primary_documents) else ''
+                description = descriptions[i] if i < len(descriptions) else ''
+                
                 # Construct document URL
                 accession_clean = accession.replace('-', '')
                 document_url = f"https://www.sec.gov/Archives/edgar/data/{cik}/{accession_clean}/{primary_doc}"
@@ -193,7 +368,7 @@ class EdgarAPIClient:
             document_url = f"https://www.sec.gov/Archives/edgar/data/{cik}/{accession_clean}/{primary_document}"
             
             # Fetch document content with rate limiting
-            time.sleep(0.1)  # SEC API rate limit compliance
+            self._throttle()  # SEC API rate limit compliance
             response = self.session.get(document_url, timeout=30)
             response.raise_for_status()
             
@@ -248,6 +423,9 @@ class EdgarAPIClient:
         """
         Get content for multiple SEC filings
         
+        Documents are fetched concurrently; request starts are still paced
+        by the shared SEC rate limiter. Results keep the input order.
+        
         Args:
             filings_data: List of filing data dictionaries with keys:
                          ticker, accession_number, primary_document
@@ -256,36 +434,36 @@ class EdgarAPIClient:
         Returns:
             List of content dictionaries
         """
-        results = []
+        results: List[Optional[Dict[str, Any]]] = [None] * len(filings_data)
+        pending = {}
         
-        for i, filing_data in enumerate(filings_data):
-            logger.info(f"Processing filing {i+1}/{len(filings_data)}")
-            
-            ticker = filing_data.get('ticker')
-            accession = filing_data.get('accession_number')
-            primary_doc = filing_data.get('primary_document')
-            
-            if not all([ticker, accession, primary_doc]):
-                results.append({
-                    'content': '',
-                    'metadata': filing_data,
-                    'status': 'error',
-                    'error': 'Missing required filing data fields'
-                })
-                continue
-            
-            content = self.get_filing_document_content(
-                ticker=ticker,
-                accession_number=accession,
-                primary_document=primary_doc,
-                max_length=max_length
-            )
-            
-            results.append(content)
-            
-            # Rate limiting between requests
-            if i < len(filings_data) - 1:
-                time.sleep(0.2)
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_FETCHES) as executor:
+            for i, filing_data in enumerate(filings_data):
+                logger.info(f"Processing filing {i+1}/{len(filings_data)}")
+                
+                ticker = filing_data.get('ticker')
+                accession = filing_data.get('accession_number')
+                primary_doc = filing_data.get('primary_document')
+                
+                if not all([ticker, accession, primary_doc]):
+                    results[i] = {
+                        'content': '',
+                        'metadata': filing_data,
+                        'status': 'error',
+                        'error': 'Missing required filing data fields'
+                    }
+                    continue
+                
+                pending[i] = executor.submit(
+                    self.get_filing_document_content,
+                    ticker=ticker,
+                    accession_number=accession,
+                    primary_document=primary_doc,
+                    max_length=max_length
+                )
+            
+            for i, future in pending.items():
+                results[i] = future.result()
         
         return results
     
@@ -316,10 +494,13 @@ class EdgarAPIClient:
                 return {'error': f'Could not find CIK for ticker {ticker}'}
             
             # Get concept data
-            concept_data = self.client.get_company_concept(
-                cik=cik,
-                taxonomy=taxonomy,
-                concept=concept
+            concept_data = self._cached_json(
+                f"companyconcept/{cik}/{taxonomy}/{concept}",
+                lambda: self.client.get_company_concept(
+                    cik=cik,
+                    taxonomy=taxonomy,
+                    concept=concept
+                )
             )
             
             return concept_data
@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 import asyncio
+import heapq
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional, Union
+from datetime import date, timedelta
+from io import StringIO
+from itertools import chain, islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from mcp.server.fastmcp import FastMCP
 from mcp.types import TextContent
@@ -53,12 +57,8 @@ class EdgarClientStub:
     def get_company_concept(self, *args, **kwargs):
         return {"error": "EDGAR API client is disabled due to missing dependencies"}
     
-    @property
-    def client(self):
-        class StubClient:
-            def get_company_facts(self, *args, **kwargs):
-                return None
-        return StubClient()
+    def get_company_facts(self, *args, **kwargs):
+        return None
 
 edgar_client = EdgarClientStub()
 
@@ -2360,8 +2360,7 @@ def _format_earnings_winners_list(results: List, params: Dict[str, Any]) -> List
     # サプライズ分析
     surprise_stocks = [s for s in results if s.eps_surprise and safe_float(s.eps_surprise) > 0]
     if surprise_stocks:
-        avg_eps_surprise = sum(safe_float(s.eps_surprise) for s in surprise_stocks) / len(surprise_stocks)
-        max_eps_surprise = max(safe_float(s.eps_surprise) for s in surprise_stocks)
+        _, avg_eps_surprise, max_eps_surprise = _stats_fold([safe_float(s.eps_surprise) for s in surprise_stocks])
         
         output_lines.extend([
             "",
@@ -2521,6 +2520,19 @@ def _format_earnings_calendar(results: List, include_chart_view: bool = True) ->
     
     return output_lines
 
+def _stats_fold(values: List[float]) -> Tuple[int, float, float]:
+    """Return (count, average, max) for a non-empty list of numeric values"""
+    count = len(values)
+    return count, sum(values) / count, max(values)
+
+# Markdown column widths for the earnings detail tables
+_EARNINGS_MOVER_COLUMN_WIDTHS = (6, 15, 12, 7, 8, 8, 12, 16, 7, 6)
+_EARNINGS_TRADING_COLUMN_WIDTHS = (6, 15, 12, 7, 8, 12, 16, 7, 10, 6)
+
+def _format_table_row(values: Tuple[str, ...], widths: Tuple[int, ...]) -> str:
+    """Left-justify already formatted cell values into a Markdown table row"""
+    return "| " + " | ".join([value.ljust(width) for value, width in zip(values, widths)]) + " |"
+
 def _format_earnings_premarket_list(results: List, params: Dict[str, Any]) -> List[str]:
     """寄り付き前決算上昇銘柄の詳細フォーマット"""
     def format_large_number(num):
@@ -2560,7 +2572,7 @@ def _format_earnings_premarket_list(results: List, params: Dict[str, Any]) -> Li
         "|--------|---------|--------|-------|--------|--------|--------------|------------------|---------|--------|"
     ])
     
-    for i, stock in enumerate(results[:10]):  # 上位10銘柄
+    for i, stock in enumerate(islice(results, 10)):  # 上位10銘柄
         price_str = f"${stock.price:.2f}" if stock.price else "N/A"
         change_str = f"{stock.price_change:.2f}%" if stock.price_change else "N/A"
         premarket_str = f"{stock.premarket_change_percent:.2f}%" if stock.premarket_change_percent else "N/A"
@@ -2573,7 +2585,11 @@ def _format_earnings_premarket_list(results: List, params: Dict[str, Any]) -> Li
         company_display = (stock.company_name[:15] + "...") if stock.company_name and len(stock.company_name) > 15 else (stock.company_name or "N/A")
         sector_display = (stock.sector[:12] + "...") if stock.sector and len(stock.sector) > 12 else (stock.sector or "N/A")
         
-        output_lines.append(f"| {ticker_display:<6} | {company_display:<15} | {sector_display:<12} | {price_str:<7} | {change_str:<8} | {premarket_str:<8} | {eps_surprise_str:<12} | {revenue_surprise_str:<16} | {perf_1w_str:<7} | {volume_str:<6} |")
+        output_lines.append(_format_table_row(
+            (ticker_display, company_display, sector_display, price_str, change_str, premarket_str,
+             eps_surprise_str, revenue_surprise_str, perf_1w_str, volume_str),
+            _EARNINGS_MOVER_COLUMN_WIDTHS
+        ))
     
     output_lines.extend([
         "",
@@ -2584,7 +2600,7 @@ def _format_earnings_premarket_list(results: List, params: Dict[str, Any]) -> Li
     ])
     
     # 上位5銘柄の詳細情報
-    for i, stock in enumerate(results[:5], 1):
+    for i, stock in enumerate(islice(results, 5), 1):
         output_lines.extend([
             f"#{i} 📊 {stock.ticker} - {stock.company_name}",
             f"   📈 Price: ${stock.price:.2f} | Change: {stock.price_change:.2f}%" if stock.price and stock.price_change else f"   📈 Price: {stock.price:.2f} | Change: N/A" if stock.price else "   📈 Price: N/A | Change: N/A",
@@ -2598,16 +2614,14 @@ def _format_earnings_premarket_list(results: List, params: Dict[str, Any]) -> Li
     
     # 統計情報
     eps_surprises = [s.eps_surprise for s in results if s.eps_surprise is not None]
-    revenue_surprises = [s.revenue_surprise for s in results if s.revenue_surprise is not None]
     
     if eps_surprises:
-        avg_eps = sum(eps_surprises) / len(eps_surprises)
-        max_eps = max(eps_surprises)
+        eps_count, avg_eps, max_eps = _stats_fold(eps_surprises)
         output_lines.extend([
             "📊 EPSサプライズ統計:",
             f"   • 平均: {avg_eps:.2f}%",
             f"   • 最大: {max_eps:.2f}%",
-            f"   • サンプル数: {len(eps_surprises)}",
+            f"   • サンプル数: {eps_count}",
             ""
         ])
     
@@ -2665,7 +2679,7 @@ def _format_earnings_afterhours_list(results: List, params: Dict[str, Any]) -> L
         "|--------|---------|--------|-------|--------|--------|--------------|------------------|---------|--------|"
     ])
     
-    for i, stock in enumerate(results[:10]):  # 上位10銘柄
+    for i, stock in enumerate(islice(results, 10)):  # 上位10銘柄
         price_str = f"${stock.price:.2f}" if stock.price else "N/A"
         change_str = f"{stock.price_change:.2f}%" if stock.price_change else "N/A"
         afterhours_str = f"{stock.afterhours_change_percent:.2f}%" if stock.afterhours_change_percent else "N/A"
@@ -2678,7 +2692,11 @@ def _format_earnings_afterhours_list(results: List, params: Dict[str, Any]) -> L
         company_display = (stock.company_name[:15] + "...") if stock.company_name and len(stock.company_name) > 15 else (stock.company_name or "N/A")
         sector_display = (stock.sector[:12] + "...") if stock.sector and len(stock.sector) > 12 else (stock.sector or "N/A")
         
-        output_lines.append(f"| {ticker_display:<6} | {company_display:<15} | {sector_display:<12} | {price_str:<7} | {change_str:<8} | {afterhours_str:<8} | {eps_surprise_str:<12} | {revenue_surprise_str:<16} | {perf_1w_str:<7} | {volume_str:<6} |")
+        output_lines.append(_format_table_row(
+            (ticker_display, company_display, sector_display, price_str, change_str, afterhours_str,
+             eps_surprise_str, revenue_surprise_str, perf_1w_str, volume_str),
+            _EARNINGS_MOVER_COLUMN_WIDTHS
+        ))
     
     output_lines.extend([
         "",
@@ -2689,7 +2707,7 @@ def _format_earnings_afterhours_list(results: List, params: Dict[str, Any]) -> L
     ])
     
     # 上位5銘柄の詳細情報
-    for i, stock in enumerate(results[:5], 1):
+    for i, stock in enumerate(islice(results, 5), 1):
         output_lines.extend([
             f"#{i} 📊 {stock.ticker} - {stock.company_name}",
             f"   📈 Price: ${stock.price:.2f} | Change: {stock.price_change:.2f}%" if stock.price and stock.price_change else f"   📈 Price: {stock.price:.2f} | Change: N/A" if stock.price else "   📈 Price: N/A | Change: N/A",
@@ -2703,16 +2721,14 @@ def _format_earnings_afterhours_list(results: List, params: Dict[str, Any]) -> L
     
     # 統計情報
     eps_surprises = [s.eps_surprise for s in results if s.eps_surprise is not None]
-    revenue_surprises = [s.revenue_surprise for s in results if s.revenue_surprise is not None]
     
     if eps_surprises:
-        avg_eps = sum(eps_surprises) / len(eps_surprises)
-        max_eps = max(eps_surprises)
+        eps_count, avg_eps, max_eps = _stats_fold(eps_surprises)
         output_lines.extend([
             "📊 EPSサプライズ統計:",
             f"   • 平均: {avg_eps:.2f}%",
             f"   • 最大: {max_eps:.2f}%",
-            f"   • サンプル数: {len(eps_surprises)}",
+            f"   • サンプル数: {eps_count}",
             ""
         ])
     
@@ -2773,7 +2789,7 @@ def _format_earnings_trading_list(results: List, params: Dict[str, Any]) -> List
         "|--------|---------|--------|-------|--------|--------------|------------------|---------|------------|--------|"
     ])
     
-    for i, stock in enumerate(results[:10]):  # 上位10銘柄
+    for i, stock in enumerate(islice(results, 10)):  # 上位10銘柄
         price_str = f"${stock.price:.2f}" if stock.price else "N/A"
         change_str = f"{stock.price_change:.2f}%" if stock.price_change else "N/A"
         eps_surprise_str = f"{stock.eps_surprise:.2f}%" if stock.eps_surprise else "N/A"
@@ -2786,7 +2802,11 @@ def _format_earnings_trading_list(results: List, params: Dict[str, Any]) -> List
         company_display = (stock.company_name[:15] + "...") if stock.company_name and len(stock.company_name) > 15 else (stock.company_name or "N/A")
         sector_display = (stock.sector[:12] + "...") if stock.sector and len(stock.sector) > 12 else (stock.sector or "N/A")
         
-        output_lines.append(f"| {ticker_display:<6} | {company_display:<15} | {sector_display:<12} | {price_str:<7} | {change_str:<8} | {eps_surprise_str:<12} | {revenue_surprise_str:<16} | {perf_1w_str:<7} | {volatility_str:<10} | {volume_str:<6} |")
+        output_lines.append(_format_table_row(
+            (ticker_display, company_display, sector_display, price_str, change_str,
+             eps_surprise_str, revenue_surprise_str, perf_1w_str, volatility_str, volume_str),
+            _EARNINGS_TRADING_COLUMN_WIDTHS
+        ))
     
     output_lines.extend([
         "",
@@ -2797,7 +2817,7 @@ def _format_earnings_trading_list(results: List, params: Dict[str, Any]) -> List
     ])
     
     # 上位5銘柄の詳細情報
-    for i, stock in enumerate(results[:5], 1):
+    for i, stock in enumerate(islice(results, 5), 1):
         output_lines.extend([
             f"#{i} 📊 {stock.ticker} - {stock.company_name}",
             f"   📈 Price: ${stock.price:.2f} | Change: {stock.price_change:.2f}%" if stock.price and stock.price_change else f"   📈 Price: {stock.price:.2f} | Change: N/A" if stock.price else "   📈 Price: N/A | Change: N/A",
@@ -2812,28 +2832,25 @@ def _format_earnings_trading_list(results: List, params: Dict[str, Any]) -> List
     
     # 統計情報
     eps_surprises = [s.eps_surprise for s in results if s.eps_surprise is not None]
-    revenue_surprises = [s.revenue_surprise for s in results if s.revenue_surprise is not None]
     volatilities = [s.volatility for s in results if s.volatility is not None]
     
     if eps_surprises:
-        avg_eps = sum(eps_surprises) / len(eps_surprises)
-        max_eps = max(eps_surprises)
+        eps_count, avg_eps, max_eps = _stats_fold(eps_surprises)
         output_lines.extend([
             "📊 EPSサプライズ統計:",
             f"   • 平均: {avg_eps:.2f}%",
             f"   • 最大: {max_eps:.2f}%",
-            f"   • サンプル数: {len(eps_surprises)}",
+            f"   • サンプル数: {eps_count}",
             ""
         ])
     
     if volatilities:
-        avg_volatility = sum(volatilities) / len(volatilities)
-        max_volatility = max(volatilities)
+        volatility_count, avg_volatility, max_volatility = _stats_fold(volatilities)
         output_lines.extend([
             "📊 ボラティリティ統計:",
             f"   • 平均: {avg_volatility:.2f}",
             f"   • 最大: {max_volatility:.2f}",
-            f"   • サンプル数: {len(volatilities)}",
+            f"   • サンプル数: {volatility_count}",
             ""
         ])
     
@@ -2892,15 +2909,15 @@ def get_sec_filings(
         
         # Format output
         form_filter_text = f" (Forms: {', '.join(form_types)})" if form_types else ""
-        output_lines = [
+        sections = [(
             f"📄 SEC Filings for {ticker}{form_filter_text}:",
             f"📅 Period: Last {days_back} days | Results: {len(filings)} filings",
             "=" * 80,
             ""
-        ]
+        )]
         
         for filing in filings:
-            output_lines.extend([
+            sections.append((
                 f"📅 Filing Date: {filing.filing_date} | Report Date: {filing.report_date}",
                 f"📋 Form: {filing.form}",
                 f"📝 Description: {filing.description}",
@@ -2908,9 +2925,9 @@ def get_sec_filings(
                 f"📄 Document URL: {filing.document_url}",
                 "-" * 60,
                 ""
-            ])
+            ))
         
-        return [TextContent(type="text", text="\n".join(output_lines))]
+        return [TextContent(type="text", text="\n".join(chain.from_iterable(sections)))]
         
     except (ValueError, TypeError) as e:
         logger.error(f"Validation error in get_sec_filings: {str(e)}")
@@ -2943,7 +2960,7 @@ def get_major_sec_filings(
             return [TextContent(type="text", text=f"No major SEC filings found for {ticker} in the last {days_back} days.")]
         
         # Format output
-        output_lines = [
+        sections = [(
             f"📊 Major SEC Filings for {ticker}:",
             f"📅 Period: Last {days_back} days | Results: {len(filings)} filings",
             "=" * 80,
@@ -2952,7 +2969,7 @@ def get_major_sec_filings(
             "",
             "=" * 80,
             ""
-        ]
+        )]
         
         # Group by form type for better organization
         forms_dict = {}
@@ -2963,24 +2980,24 @@ def get_major_sec_filings(
             forms_dict[form_type].append(filing)
         
         for form_type, form_filings in forms_dict.items():
-            output_lines.extend([
+            sections.append((
                 f"📋 Form {form_type} ({len(form_filings)} filings):",
                 "-" * 40,
                 ""
-            ])
+            ))
             
             for filing in form_filings:
-                output_lines.extend([
+                sections.append((
                     f"  📅 {filing.filing_date} | Report: {filing.report_date}",
                     f"  📝 {filing.description}",
                     f"  🔗 Filing: {filing.filing_url}",
                     f"  📄 Document: {filing.document_url}",
                     ""
-                ])
+                ))
             
-            output_lines.append("")
+            sections.append(("",))
         
-        return [TextContent(type="text", text="\n".join(output_lines))]
+        return [TextContent(type="text", text="\n".join(chain.from_iterable(sections)))]
         
     except (ValueError, TypeError) as e:
         logger.error(f"Validation error in get_major_sec_filings: {str(e)}")
@@ -2989,6 +3006,14 @@ def get_major_sec_filings(
         logger.error(f"Error in get_major_sec_filings: {str(e)}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
+# Short explanations for insider-related SEC form types
+_INSIDER_FORM_EXPLANATIONS = {
+    "3": "Initial ownership statement",
+    "4": "Changes in beneficial ownership",
+    "5": "Annual ownership changes",
+    "11-K": "Employee stock purchase plan report"
+}
+
 @server.tool()
 def get_insider_sec_filings(
     ticker: str,
@@ -3013,7 +3038,7 @@ def get_insider_sec_filings(
             return [TextContent(type="text", text=f"No insider SEC filings found for {ticker} in the last {days_back} days.")]
         
         # Format output
-        output_lines = [
+        sections = [(
             f"👥 Insider SEC Filings for {ticker}:",
             f"📅 Period: Last {days_back} days | Results: {len(filings)} filings",
             "=" * 80,
@@ -3026,18 +3051,13 @@ def get_insider_sec_filings(
             "",
             "=" * 80,
             ""
-        ]
+        )]
         
         for filing in filings:
             # Determine filing type explanation
-            form_explanation = {
-                "3": "Initial ownership statement",
-                "4": "Changes in beneficial ownership",
-                "5": "Annual ownership changes",
-                "11-K": "Employee stock purchase plan report"
-            }.get(filing.form, "Insider-related filing")
+            form_explanation = _INSIDER_FORM_EXPLANATIONS.get(filing.form, "Insider-related filing")
             
-            output_lines.extend([
+            sections.append((
                 f"📋 Form {filing.form} - {form_explanation}",
                 f"📅 Filing: {filing.filing_date} | Report: {filing.report_date}",
                 f"📝 {filing.description}",
@@ -3045,9 +3065,9 @@ def get_insider_sec_filings(
                 f"📄 Document: {filing.document_url}",
                 "-" * 60,
                 ""
-            ])
+            ))
         
-        return [TextContent(type="text", text="\n".join(output_lines))]
+        return [TextContent(type="text", text="\n".join(chain.from_iterable(sections)))]
         
     except (ValueError, TypeError) as e:
         logger.error(f"Validation error in get_insider_sec_filings: {str(e)}")
@@ -3098,9 +3118,12 @@ def get_sec_filing_summary(
         forms = summary.get("forms", {})
         sorted_forms = sorted(forms.items(), key=lambda x: x[1], reverse=True)
         
+        # Compute the count-to-percentage factor once
+        total_filings = summary['total_filings']
+        pct_factor = 100.0 / total_filings if total_filings > 0 else 0.0
+        
         for form_type, count in sorted_forms:
-            percentage = (count / summary['total_filings'] * 100) if summary['total_filings'] > 0 else 0
-            output_lines.append(f"  📋 {form_type}: {count} filings ({percentage:.1f}%)")
+            output_lines.append(f"  📋 {form_type}: {count} filings ({count * pct_factor:.1f}%)")
         
         output_lines.extend([
             "",
@@ -3122,6 +3145,11 @@ def get_sec_filing_summary(
         logger.error(f"Error in get_sec_filing_summary: {str(e)}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
+# Section separators shared by the EDGAR tools
+_EDGAR_RULE = "=" * 80
+_EDGAR_ITEM_RULE = "-" * 60
+_EDGAR_FACTS_RULE = "=" * 60
+
 @server.tool()
 def get_edgar_filing_content(
     ticker: str,
@@ -3165,7 +3193,7 @@ def get_edgar_filing_content(
             f"🔗 Document: {accession_number}/{primary_document}",
             f"📅 Retrieved: {metadata.get('retrieved_at', 'N/A')}",
             f"📊 Content Length: {metadata.get('content_length', 0):,} characters",
-            "=" * 80,
+            _EDGAR_RULE,
             "",
             content[:max_length] if len(content) > max_length else content
         ]
@@ -3173,7 +3201,7 @@ def get_edgar_filing_content(
         if len(content) > max_length:
             output_lines.extend([
                 "",
-                "=" * 80,
+                _EDGAR_RULE,
                 f"[Content truncated - showing first {max_length:,} characters]"
             ])
         
@@ -3226,51 +3254,52 @@ def get_multiple_edgar_filing_contents(
         if not results:
             return [TextContent(type="text", text=f"No document contents retrieved for {ticker}.")]
         
-        # Format output
-        output_lines = [
-            f"📄 Multiple SEC Filing Document Contents for {ticker}:",
-            f"📊 Retrieved: {len(results)} documents",
-            "=" * 80,
-            ""
-        ]
+        # Format output into a single buffer (every line is newline-terminated)
+        buf = StringIO()
+        buf.write(
+            f"📄 Multiple SEC Filing Document Contents for {ticker}:\n"
+            f"📊 Retrieved: {len(results)} documents\n"
+            f"{_EDGAR_RULE}\n"
+            "\n"
+        )
         
         for i, result in enumerate(results, 1):
             metadata = result.get('metadata', {})
             content = result.get('content', '')
             status = result.get('status', 'unknown')
             
-            output_lines.extend([
-                f"📋 Document {i}/{len(results)}:",
-                f"   📄 File: {metadata.get('accession_number', 'N/A')}/{metadata.get('primary_document', 'N/A')}",
-                f"   📅 Retrieved: {metadata.get('retrieved_at', 'N/A')}",
-                f"   📊 Length: {metadata.get('content_length', 0):,} characters",
-                f"   ✅ Status: {status}",
-                ""
-            ])
+            # Blank line between document blocks
+            if i > 1:
+                buf.write("\n")
+            
+            buf.write(
+                f"📋 Document {i}/{len(results)}:\n"
+                f"   📄 File: {metadata.get('accession_number', 'N/A')}/{metadata.get('primary_document', 'N/A')}\n"
+                f"   📅 Retrieved: {metadata.get('retrieved_at', 'N/A')}\n"
+                f"   📊 Length: {metadata.get('content_length', 0):,} characters\n"
+                f"   ✅ Status: {status}\n"
+                "\n"
+            )
             
             if status == 'error':
                 error_msg = result.get('error', 'Unknown error')
-                output_lines.extend([
-                    f"   ❌ Error: {error_msg}",
-                    ""
-                ])
+                buf.write(f"   ❌ Error: {error_msg}\n\n")
             else:
                 # Show first 500 characters of content
                 preview_length = min(500, len(content))
                 preview = content[:preview_length]
-                output_lines.extend([
-                    f"   📝 Content Preview ({preview_length} chars):",
-                    f"   {preview}",
-                    ""
-                ])
+                buf.write(
+                    f"   📝 Content Preview ({preview_length} chars):\n"
+                    f"   {preview}\n"
+                    "\n"
+                )
                 
                 if len(content) > preview_length:
-                    output_lines.append(f"   [... {len(content) - preview_length:,} more characters]")
-                    output_lines.append("")
+                    buf.write(f"   [... {len(content) - preview_length:,} more characters]\n\n")
             
-            output_lines.extend(["-" * 60, ""])
+            buf.write(f"{_EDGAR_ITEM_RULE}\n")
         
-        return [TextContent(type="text", text="\n".join(output_lines))]
+        return [TextContent(type="text", text=buf.getvalue())]
         
     except (ValueError, TypeError) as e:
         logger.error(f"Validation error in get_multiple_edgar_filing_contents: {str(e)}")
@@ -3279,6 +3308,52 @@ def get_multiple_edgar_filing_contents(
         logger.error(f"Error in get_multiple_edgar_filing_contents: {str(e)}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
+# Fixed header block listing the common form types
+_EDGAR_FORM_TYPES_LINES = (
+    _EDGAR_RULE,
+    "",
+    "📋 Available Form Types:",
+    "  • 10-K: Annual report",
+    "  • 10-Q: Quarterly report",
+    "  • 8-K: Current report (material events)",
+    "  • DEF 14A: Proxy statement",
+    "  • 4: Statement of changes in beneficial ownership",
+    "",
+    _EDGAR_RULE,
+    "",
+)
+
+def _render_edgar_company_filings(
+    ticker: str,
+    filings: List[Dict[str, Any]],
+    form_types: Optional[List[str]],
+    date_from: str,
+    date_to: str,
+    days_back: int
+) -> Iterator[str]:
+    """Yield output lines for get_edgar_company_filings"""
+    yield f"📊 EDGAR Company Filings for {ticker}:"
+    yield f"📅 Period: {date_from} to {date_to} ({days_back} days)"
+    yield f"📄 Results: {len(filings)} filings"
+    
+    if form_types:
+        yield f"📋 Form Filter: {', '.join(form_types)}"
+    
+    yield from _EDGAR_FORM_TYPES_LINES
+    
+    for filing in filings:
+        yield f"📋 Form {filing['form']} - {filing.get('description', 'N/A')}"
+        yield f"📅 Filing: {filing['filing_date']} | Report: {filing['report_date']}"
+        yield f"📄 Document: {filing['accession_number']}/{filing['primary_document']}"
+        yield f"🔗 Filing URL: {filing['filing_url']}"
+        yield f"📄 Document URL: {filing['document_url']}"
+        yield _EDGAR_ITEM_RULE
+        yield ""
+    
+    yield ""
+    yield "💡 To get document content, use get_edgar_filing_content with:"
+    yield "   ticker, accession_number, and primary_document from above"
+
 @server.tool()
 def get_edgar_company_filings(
     ticker: str,
@@ -3303,9 +3378,9 @@ def get_edgar_company_filings(
         logger.info(f"Fetching EDGAR filings for {ticker} via EDGAR API")
         
         # Calculate date range
-        from datetime import datetime, timedelta
-        date_to = datetime.now().strftime('%Y-%m-%d')
-        date_from = (datetime.now() - timedelta(days=days_back)).strftime('%Y-%m-%d')
+        today = date.today()
+        date_to = today.isoformat()
+        date_from = (today - timedelta(days=days_back)).isoformat()
         
         # Get company filings via EDGAR API
         filings = edgar_client.get_company_filings(
@@ -3321,47 +3396,10 @@ def get_edgar_company_filings(
             return [TextContent(type="text", text=f"No EDGAR filings found for {ticker}{form_filter_text} in the last {days_back} days.")]
         
         # Format output
-        output_lines = [
-            f"📊 EDGAR Company Filings for {ticker}:",
-            f"📅 Period: {date_from} to {date_to} ({days_back} days)",
-            f"📄 Results: {len(filings)} filings",
-        ]
-        
-        if form_types:
-            output_lines.append(f"📋 Form Filter: {', '.join(form_types)}")
-        
-        output_lines.extend([
-            "=" * 80,
-            "",
-            "📋 Available Form Types:",
-            "  • 10-K: Annual report",
-            "  • 10-Q: Quarterly report", 
-            "  • 8-K: Current report (material events)",
-            "  • DEF 14A: Proxy statement",
-            "  • 4: Statement of changes in beneficial ownership",
-            "",
-            "=" * 80,
-            ""
-        ])
-        
-        for filing in filings:
-            output_lines.extend([
-                f"📋 Form {filing['form']} - {filing.get('description', 'N/A')}",
-                f"📅 Filing: {filing['filing_date']} | Report: {filing['report_date']}",
-                f"📄 Document: {filing['accession_number']}/{filing['primary_document']}",
-                f"🔗 Filing URL: {filing['filing_url']}",
-                f"📄 Document URL: {filing['document_url']}",
-                "-" * 60,
-                ""
-            ])
-        
-        output_lines.extend([
-            "",
-            "💡 To get document content, use get_edgar_filing_content with:",
-            "   ticker, accession_number, and primary_document from above"
-        ])
-        
-        return [TextContent(type="text", text="\n".join(output_lines))]
+        output_text = "\n".join(
+            _render_edgar_company_filings(ticker, filings, form_types, date_from, date_to, days_back)
+        )
+        return [TextContent(type="text", text=output_text)]
         
     except (ValueError, TypeError) as e:
         logger.error(f"Validation error in get_edgar_company_filings: {str(e)}")
@@ -3370,6 +3408,44 @@ def get_edgar_company_filings(
         logger.error(f"Error in get_edgar_company_filings: {str(e)}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
+def _render_edgar_company_facts(ticker: str, company_facts: Dict[str, Any]) -> Iterator[str]:
+    """Yield output lines for get_edgar_company_facts"""
+    # Extract basic information
+    cik = company_facts.get('cik', 'N/A')
+    entity_name = company_facts.get('entityName', 'N/A')
+    
+    yield f"🏢 EDGAR Company Facts for {ticker}:"
+    yield f"📊 Entity Name: {entity_name}"
+    yield f"🔢 CIK: {cik}"
+    yield _EDGAR_FACTS_RULE
+    yield ""
+    
+    # Show available facts/concepts
+    facts = company_facts.get('facts', {})
+    if facts:
+        yield "📋 Available Financial Concepts:"
+        yield ""
+        
+        # Group by taxonomy
+        for taxonomy, concepts in facts.items():
+            if concepts:
+                yield f"📊 {taxonomy.upper()} Taxonomy:"
+                yield f"   📈 Available concepts: {len(concepts)}"
+                yield ""
+                
+                # Show first few concepts as examples
+                for concept, concept_data in islice(concepts.items(), 5):
+                    description = concept_data.get('description', concept)
+                    yield f"   • {concept}: {description}"
+                
+                if len(concepts) > 5:
+                    yield f"   ... and {len(concepts) - 5} more concepts"
+                
+                yield ""
+    
+    yield "💡 To get specific concept data, use get_edgar_company_concept with:"
+    yield f"   ticker='{ticker}', concept='Assets', taxonomy='us-gaap'"
+
 @server.tool()
 def get_edgar_company_facts(
     ticker: str
@@ -3394,61 +3470,16 @@ def get_edgar_company_facts(
         
         # Get company facts via EDGAR API
         try:
-            company_facts = edgar_client.client.get_company_facts(cik)
+            company_facts = edgar_client.get_company_facts(cik)
         except Exception as e:
             return [TextContent(type="text", text=f"Error fetching company facts for {ticker}: {str(e)}")]
         
         if not company_facts:
             return [TextContent(type="text", text=f"No company facts found for {ticker}.")]
         
-        # Extract basic information
-        cik = company_facts.get('cik', 'N/A')
-        entity_name = company_facts.get('entityName', 'N/A')
-        
         # Format output
-        output_lines = [
-            f"🏢 EDGAR Company Facts for {ticker}:",
-            f"📊 Entity Name: {entity_name}",
-            f"🔢 CIK: {cik}",
-            "=" * 60,
-            ""
-        ]
-        
-        # Show available facts/concepts
-        facts = company_facts.get('facts', {})
-        if facts:
-            output_lines.extend([
-                "📋 Available Financial Concepts:",
-                ""
-            ])
-            
-            # Group by taxonomy
-            for taxonomy, concepts in facts.items():
-                if concepts:
-                    output_lines.extend([
-                        f"📊 {taxonomy.upper()} Taxonomy:",
-                        f"   📈 Available concepts: {len(concepts)}",
-                        ""
-                    ])
-                    
-                    # Show first few concepts as examples
-                    concept_names = list(concepts.keys())[:5]
-                    for concept in concept_names:
-                        concept_data = concepts[concept]
-                        description = concept_data.get('description', concept)
-                        output_lines.append(f"   • {concept}: {description}")
-                    
-                    if len(concepts) > 5:
-                        output_lines.append(f"   ... and {len(concepts) - 5} more concepts")
-                    
-                    output_lines.append("")
-        
-        output_lines.extend([
-            "💡 To get specific concept data, use get_edgar_company_concept with:",
-            f"   ticker='{ticker}', concept='Assets', taxonomy='us-gaap'"
-        ])
-        
-        return [TextContent(type="text", text="\n".join(output_lines))]
+        output_text = "\n".join(_render_edgar_company_facts(ticker, company_facts))
+        return [TextContent(type="text", text=output_text)]
         
     except (ValueError, TypeError) as e:
         logger.error(f"Validation error in get_edgar_company_facts: {str(e)}")
@@ -3457,6 +3488,80 @@ def get_edgar_company_facts(
         logger.error(f"Error in get_edgar_company_facts: {str(e)}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
+# (divisor, suffix) pairs for concept values, largest first
+_CONCEPT_VALUE_SCALES = ((1_000_000_000, 'B'), (1_000_000, 'M'), (1_000, 'K'))
+
+def _format_concept_value(value: Union[int, float]) -> str:
+    """Format a numeric concept value with a B/M/K suffix"""
+    for divisor, suffix in _CONCEPT_VALUE_SCALES:
+        if value >= divisor:
+            return f"${value/divisor:.2f}{suffix}"
+    return f"${value:,.2f}"
+
+def _concept_recent_value_lines(unit_data: List[Dict[str, Any]]) -> Iterator[str]:
+    """Yield the 10 most recent concept values as output lines"""
+    # Select the 10 most recent entries by end date without sorting the full history
+    recent_data = heapq.nlargest(10, unit_data, key=lambda x: x.get('end', ''))
+    
+    for entry in recent_data:
+        end_date = entry.get('end', 'N/A')
+        value = entry.get('val', 'N/A')
+        form = entry.get('form', 'N/A')
+        filed = entry.get('filed', 'N/A')
+        
+        # Format large numbers
+        if isinstance(value, (int, float)):
+            formatted_value = _format_concept_value(value)
+        else:
+            formatted_value = str(value)
+        
+        yield f"   • {end_date}: {formatted_value} ({form} filed: {filed})"
+
+def _render_edgar_company_concept(
+    ticker: str,
+    concept: str,
+    taxonomy: str,
+    concept_data: Dict[str, Any]
+) -> Iterator[str]:
+    """Yield output lines for get_edgar_company_concept"""
+    # Extract basic information
+    cik = concept_data.get('cik', 'N/A')
+    entity_name = concept_data.get('entityName', 'N/A')
+    concept_label = concept_data.get('label', concept)
+    description = concept_data.get('description', 'N/A')
+    
+    yield f"📊 EDGAR Company Concept: {ticker} - {concept}"
+    yield f"🏢 Entity: {entity_name} (CIK: {cik})"
+    yield f"📋 Concept: {concept_label}"
+    yield f"📝 Description: {description}"
+    yield f"🏷️ Taxonomy: {taxonomy}"
+    yield _EDGAR_RULE
+    yield ""
+    
+    # Show units and values
+    units = concept_data.get('units', {})
+    if not units:
+        yield "⚠️ No unit data available for this concept."
+        return
+    
+    yield "📊 Available Data Units:"
+    yield ""
+    
+    for unit_type, unit_data in units.items():
+        yield f"💰 Unit: {unit_type}"
+        yield f"   📈 Data points: {len(unit_data)}"
+        yield ""
+        
+        # Show recent values
+        if unit_data:
+            yield "   📅 Recent Values:"
+            yield from _concept_recent_value_lines(unit_data)
+            
+            if len(unit_data) > 10:
+                yield f"   ... and {len(unit_data) - 10} more entries"
+        
+        yield ""
+
 @server.tool()
 def get_edgar_company_concept(
     ticker: str,
@@ -3488,71 +3593,9 @@ def get_edgar_company_concept(
         if 'error' in concept_data:
             return [TextContent(type="text", text=f"Error: {concept_data['error']}")]
         
-        # Extract basic information
-        cik = concept_data.get('cik', 'N/A')
-        entity_name = concept_data.get('entityName', 'N/A')
-        concept_label = concept_data.get('label', concept)
-        description = concept_data.get('description', 'N/A')
-        
         # Format output
-        output_lines = [
-            f"📊 EDGAR Company Concept: {ticker} - {concept}",
-            f"🏢 Entity: {entity_name} (CIK: {cik})",
-            f"📋 Concept: {concept_label}",
-            f"📝 Description: {description}",
-            f"🏷️ Taxonomy: {taxonomy}",
-            "=" * 80,
-            ""
-        ]
-        
-        # Show units and values
-        units = concept_data.get('units', {})
-        if units:
-            output_lines.append("📊 Available Data Units:")
-            output_lines.append("")
-            
-            for unit_type, unit_data in units.items():
-                output_lines.extend([
-                    f"💰 Unit: {unit_type}",
-                    f"   📈 Data points: {len(unit_data)}",
-                    ""
-                ])
-                
-                # Show recent values
-                if unit_data:
-                    output_lines.append("   📅 Recent Values:")
-                    # Sort by end date (most recent first)
-                    sorted_data = sorted(unit_data, key=lambda x: x.get('end', ''), reverse=True)
-                    
-                    for i, entry in enumerate(sorted_data[:10]):  # Show last 10 entries
-                        end_date = entry.get('end', 'N/A')
-                        value = entry.get('val', 'N/A')
-                        form = entry.get('form', 'N/A')
-                        filed = entry.get('filed', 'N/A')
-                        
-                        # Format large numbers
-                        if isinstance(value, (int, float)):
-                            if value >= 1_000_000_000:
-                                formatted_value = f"${value/1_000_000_000:.2f}B"
-                            elif value >= 1_000_000:
-                                formatted_value = f"${value/1_000_000:.2f}M"
-                            elif value >= 1_000:
-                                formatted_value = f"${value/1_000:.2f}K"
-                            else:
-                                formatted_value = f"${value:,.2f}"
-                        else:
-                            formatted_value = str(value)
-                        
-                        output_lines.append(f"   • {end_date}: {formatted_value} ({form} filed: {filed})")
-                    
-                    if len(sorted_data) > 10:
-                        output_lines.append(f"   ... and {len(sorted_data) - 10} more entries")
-                
-                output_lines.append("")
-        else:
-            output_lines.append("⚠️ No unit data available for this concept.")
-        
-        return [TextContent(type="text", text="\n".join(output_lines))]
+        output_text = "\n".join(_render_edgar_company_concept(ticker, concept, taxonomy, concept_data))
+        return [TextContent(type="text", text=output_text)]
         
     except (ValueError, TypeError) as e:
         logger.error(f"Validation error in get_edgar_company_concept: {str(e)}")
@@ -1,6 +1,17 @@
-from typing import List, Dict, Any, Optional
+from collections import Counter
+from functools import lru_cache
+from itertools import zip_longest
+from operator import attrgetter
+from typing import Callable, List, Dict, Any, Optional
 from ..models import StockData, SectorPerformance, NewsData
 
+# フィールド種別ごとの分類
+_PRICE_FIELDS = frozenset({'price', 'target_price', 'week_52_high', 'week_52_low'})
+_PERCENT_FIELDS = frozenset({'price_change', 'dividend_yield', 'performance_1w', 'performance_1m',
+                             'eps_surprise', 'revenue_surprise'})
+_VOLUME_FIELDS = frozenset({'volume', 'avg_volume'})
+_RATIO_FIELDS = frozenset({'relative_volume', 'pe_ratio', 'beta'})
+
 def format_stock_data_table(stocks: List[StockData], fields: Optional[List[str]] = None) -> str:
     """
     株式データをテーブル形式でフォーマット
@@ -38,15 +49,17 @@ def format_stock_data_table(stocks: List[StockData], fields: Optional[List[str]]
     
     headers = [header_mapping.get(field, field.title()) for field in fields]
     
-    # データ行
-    rows = []
-    for stock in stocks:
-        row = []
-        for field in fields:
-            value = getattr(stock, field, None)
-            formatted_value = format_field_value(field, value)
-            row.append(formatted_value)
-        rows.append(row)
+    # データ行（フォーマッタは列ごとに一度だけ解決し、列単位で整形）
+    columns = []
+    for field in fields:
+        formatter = _get_field_formatter(field)
+        try:
+            values = list(map(attrgetter(field), stocks))
+        except AttributeError:
+            # 属性を持たない行がある場合のみ None をデフォルトとして取得
+            values = [getattr(stock, field, None) for stock in stocks]
+        columns.append([formatter(value) if value is not None else "N/A" for value in values])
+    rows = [list(row) for row in zip(*columns)]
     
     # テーブル作成
     return create_ascii_table(headers, rows)
@@ -70,39 +83,63 @@ def format_large_number(num: float) -> str:
     else:
         return f"{num:.0f}"
 
-def format_field_value(field: str, value: Any) -> str:
+def _format_price_value(value: Any) -> str:
+    return f"${value:.2f}" if isinstance(value, (int, float)) else str(value)
+
+def _format_percent_value(value: Any) -> str:
+    return f"{value:.2f}%" if isinstance(value, (int, float)) else str(value)
+
+def _format_volume_value(value: Any) -> str:
+    return format_large_number(value) if isinstance(value, (int, float)) else str(value)
+
+def _format_ratio_value(value: Any) -> str:
+    return f"{value:.2f}x" if isinstance(value, (int, float)) else str(value)
+
+@lru_cache(maxsize=None)
+def _get_field_formatter(field: str) -> Callable[[Any], str]:
     """
-    フィールド値をフォーマット
+    フィールド名に対応する値フォーマッタを取得（フィールドごとに一度だけ解決）
     
     Args:
         field: フィールド名
-        value: 値
         
     Returns:
-        フォーマットされた文字列
+        None以外の値を文字列に変換する関数
     """
-    if value is None:
-        return "N/A"
-    
     # 価格フィールド
-    if field in ['price', 'target_price', 'week_52_high', 'week_52_low']:
-        return f"${value:.2f}" if isinstance(value, (int, float)) else str(value)
+    if field in _PRICE_FIELDS:
+        return _format_price_value
     
     # パーセンテージフィールド
-    if field in ['price_change', 'dividend_yield', 'performance_1w', 'performance_1m', 
-                'eps_surprise', 'revenue_surprise']:
-        return f"{value:.2f}%" if isinstance(value, (int, float)) else str(value)
+    if field in _PERCENT_FIELDS:
+        return _format_percent_value
     
     # 出来高フィールド
-    if field in ['volume', 'avg_volume']:
-        return format_large_number(value) if isinstance(value, (int, float)) else str(value)
+    if field in _VOLUME_FIELDS:
+        return _format_volume_value
     
     # 倍率フィールド
-    if field in ['relative_volume', 'pe_ratio', 'beta']:
-        return f"{value:.2f}x" if isinstance(value, (int, float)) else str(value)
+    if field in _RATIO_FIELDS:
+        return _format_ratio_value
     
     # そのまま表示
-    return str(value)
+    return str
+
+def format_field_value(field: str, value: Any) -> str:
+    """
+    フィールド値をフォーマット
+    
+    Args:
+        field: フィールド名
+        value: 値
+        
+    Returns:
+        フォーマットされた文字列
+    """
+    if value is None:
+        return "N/A"
+    
+    return _get_field_formatter(field)(value)
 
 def create_ascii_table(headers: List[str], rows: List[List[str]]) -> str:
     """
@@ -118,13 +155,12 @@ def create_ascii_table(headers: List[str], rows: List[List[str]]) -> str:
     if not headers or not rows:
         return ""
     
-    # 各列の最大幅を計算
+    # 各列の最大幅を計算（行を一度だけ転置し、列ごとに組み込みmaxで集計）
+    columns = list(zip_longest(*rows, fillvalue=""))
     col_widths = []
     for i, header in enumerate(headers):
-        max_width = len(header)
-        for row in rows:
-            if i < len(row):
-                max_width = max(max_width, len(str(row[i])))
+        cells = columns[i] if i < len(columns) else ()
+        max_width = max(len(header), max(map(len, map(str, cells)), default=0))
         col_widths.append(min(max_width, 20))  # 最大20文字に制限
     
     # ヘッダー行
@@ -134,11 +170,8 @@ def create_ascii_table(headers: List[str], rows: List[List[str]]) -> str:
     # データ行
     data_lines = []
     for row in rows:
-        padded_row = []
-        for i, cell in enumerate(row):
-            if i < len(col_widths):
-                cell_str = str(cell)[:col_widths[i]]  # 幅制限
-                padded_row.append(cell_str.ljust(col_widths[i]))
+        # 幅制限してパディング（ヘッダーより多いセルは無視）
+        padded_row = [str(cell)[:width].ljust(width) for cell, width in zip(row, col_widths)]
         data_line = "| " + " | ".join(padded_row) + " |"
         data_lines.append(data_line)
     
@@ -173,25 +206,16 @@ def format_earnings_summary(stocks: List[StockData]) -> str:
     ]
     
     # セクター別集計
-    sector_counts = {}
-    positive_surprises = 0
-    negative_surprises = 0
-    
-    for stock in stocks:
-        # セクター集計
-        sector = stock.sector or "Unknown"
-        sector_counts[sector] = sector_counts.get(sector, 0) + 1
-        
-        # サプライズ集計
-        if stock.eps_surprise:
-            if stock.eps_surprise > 0:
-                positive_surprises += 1
-            else:
-                negative_surprises += 1
+    sector_counts = Counter(stock.sector or "Unknown" for stock in stocks)
+    
+    # サプライズ集計（0・未設定は除外）
+    surprises = [stock.eps_surprise for stock in stocks if stock.eps_surprise]
+    positive_surprises = sum(1 for surprise in surprises if surprise > 0)
+    negative_surprises = len(surprises) - positive_surprises
     
     # セクター別結果
     summary_lines.append("Sector Breakdown:")
-    for sector, count in sorted(sector_counts.items(), key=lambda x: x[1], reverse=True):
+    for sector, count in sector_counts.most_common():
         summary_lines.append(f"  {sector}: {count} stocks")
     
     summary_lines.extend([
@@ -265,6 +289,31 @@ def format_news_summary(news_list: List[NewsData]) -> str:
     
     return "\n".join(summary_lines)
 
+class _RunningStats:
+    """件数・合計・最小・最大を1パスで集計するアキュムレータ"""
+    
+    __slots__ = ('count', 'total', 'min', 'max')
+    
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0
+        self.min: Any = None
+        self.max: Any = None
+    
+    def add(self, value: Any) -> None:
+        if self.count == 0:
+            self.min = self.max = value
+        elif value < self.min:
+            self.min = value
+        elif value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+    
+    @property
+    def mean(self) -> float:
+        return self.total / self.count
+
 def format_screening_result_summary(stocks: List[StockData], params: Dict[str, Any]) -> str:
     """
     スクリーニング結果のサマリーをフォーマット
@@ -292,26 +341,33 @@ def format_screening_result_summary(stocks: List[StockData], params: Dict[str, A
     summary_lines.append("")
     
     if stocks:
-        # 統計情報
-        prices = [s.price for s in stocks if s.price is not None]
-        changes = [s.price_change for s in stocks if s.price_change is not None]
-        volumes = [s.volume for s in stocks if s.volume is not None]
+        # 統計情報（1パスで価格・騰落率・出来高を集計）
+        prices = _RunningStats()
+        changes = _RunningStats()
+        volumes = _RunningStats()
+        for stock in stocks:
+            if stock.price is not None:
+                prices.add(stock.price)
+            if stock.price_change is not None:
+                changes.add(stock.price_change)
+            if stock.volume is not None:
+                volumes.add(stock.volume)
         
-        if prices:
+        if prices.count:
             summary_lines.extend([
                 "Statistics:",
-                f"  Price range: ${min(prices):.2f} - ${max(prices):.2f}",
-                f"  Average price: ${sum(prices)/len(prices):.2f}"
+                f"  Price range: ${prices.min:.2f} - ${prices.max:.2f}",
+                f"  Average price: ${prices.mean:.2f}"
             ])
         
-        if changes:
+        if changes.count:
             summary_lines.extend([
-                f"  Change range: {min(changes):.2f}% - {max(changes):.2f}%",
-                f"  Average change: {sum(changes)/len(changes):.2f}%"
+                f"  Change range: {changes.min:.2f}% - {changes.max:.2f}%",
+                f"  Average change: {changes.mean:.2f}%"
             ])
         
-        if volumes:
-            summary_lines.append(f"  Average volume: {format_large_number(sum(volumes)/len(volumes))}")
+        if volumes.count:
+            summary_lines.append(f"  Average volume: {format_large_number(volumes.mean)}")
         
         summary_lines.append("")
     
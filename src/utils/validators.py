@@ -1,6 +1,225 @@
 import re
-from typing import Optional, List, Any, Dict, Union
-from ..constants import ALL_PARAMETERS
+from types import MappingProxyType
+from typing import Optional, List, Any, Dict, Iterator, Mapping, Tuple, Union
+from ..constants import ALL_PARAMETERS, FINVIZ_COMPREHENSIVE_FIELD_MAPPING
+
+# sanitize_input で除去する危険な文字の変換テーブル
+_SANITIZE_TABLE = str.maketrans('', '', '<>"\'&;()|`')
+# 危険な文字を含むかの事前判定用（含まない入力は変換テーブルを通さない）
+_DANGEROUS_CHARS_RE = re.compile('[<>"\'&;()|`]')
+
+# Finvizパラメータキーごとの有効値（ALL_PARAMETERSのキー集合）
+_VALID_PARAMETER_VALUES = {key: frozenset(values) for key, values in ALL_PARAMETERS.items()}
+
+# get_all_valid_values が返す読み取り専用の有効値一覧
+_ALL_VALID_VALUES = MappingProxyType({param: tuple(values) for param, values in ALL_PARAMETERS.items()})
+
+# 決算発表日フィルタのAPIレベル有効値
+_VALID_EARNINGS_DATES = frozenset({
+    'today_after',
+    'today_before',
+    'tomorrow_after',
+    'tomorrow_before',
+    'yesterday_after',
+    'yesterday_before',
+    'this_week',
+    'next_week',
+    'within_2_weeks',
+    'thisweek',
+    'nextweek',
+    'nextdays5'
+})
+
+# APIレベルの有効なセクター名
+_VALID_SECTORS = frozenset({
+    # ユーザーフレンドリーなセクター名
+    'Basic Materials',
+    'Communication Services',
+    'Consumer Cyclical',
+    'Consumer Defensive',
+    'Energy',
+    'Financial',
+    'Healthcare',
+    'Industrials',
+    'Real Estate',
+    'Technology',
+    'Utilities',
+    # 内部パラメータ値も受け入れ
+    'basicmaterials',
+    'communicationservices',
+    'consumercyclical',
+    'consumerdefensive',
+    'energy',
+    'financial',
+    'healthcare',
+    'industrials',
+    'realestate',
+    'technology',
+    'utilities'
+})
+
+# 文字列長ごとのセクター名（長さが合わない入力はハッシュ計算前に除外）
+_VALID_SECTORS_BY_LENGTH = {
+    length: frozenset(sector for sector in _VALID_SECTORS if len(sector) == length)
+    for length in {len(sector) for sector in _VALID_SECTORS}
+}
+
+# SMAフィルタの有効値
+_VALID_SMA_FILTERS = frozenset({
+    'above_sma20', 'above_sma50', 'above_sma200',
+    'below_sma20', 'below_sma50', 'below_sma200', 'none'
+})
+
+# ソート基準・ソート順序の有効値
+_VALID_SORT_OPTIONS = frozenset({
+    'ticker', 'company', 'sector', 'industry', 'country',
+    'market_cap', 'pe', 'price', 'change', 'volume',
+    'price_change', 'relative_volume', 'performance_week',
+    'performance_month', 'performance_quarter', 'performance_year',
+    'analyst_recom', 'avg_volume', 'dividend_yield',
+    'eps', 'sales', 'float', 'insider_own', 'inst_own',
+    'rsi', 'volatility', 'earnings_date', 'ipo_date'
+})
+_VALID_SORT_ORDERS = frozenset({'asc', 'desc'})
+
+# スクリーナービューの有効値
+_VALID_VIEWS = frozenset({'111', '121', '131', '141', '151', '161', '171'})
+
+# スクリーニングパラメータ名とALL_PARAMETERSキーの対応（検証順）
+_BASIC_SCREENING_PARAMS = (
+    ('exchange', 'exch'),
+    ('index', 'idx'),
+    ('sector', 'sec'),
+    ('industry', 'ind'),
+    ('country', 'geo'),
+    ('market_cap', 'cap'),
+    ('price', 'sh_price'),
+    ('target_price', 'targetprice'),
+    ('dividend_yield', 'fa_div'),
+    ('short_float', 'sh_short'),
+    ('analyst_recommendation', 'an_recom'),
+    ('option_short', 'sh_opt'),
+    ('earnings_date', 'earningsdate'),
+    ('ipo_date', 'ipodate'),
+    ('average_volume', 'sh_avgvol'),
+    ('relative_volume', 'sh_relvol'),
+    ('current_volume', 'sh_curvol'),
+    ('trades', 'sh_trades'),
+    ('shares_outstanding', 'sh_outstanding'),
+    ('float', 'sh_float')
+)
+
+# 数値でなければならない範囲パラメータ（検証順）
+_NUMERIC_RANGE_PARAMS = (
+    'pe_min', 'pe_max', 'forward_pe_min', 'forward_pe_max',
+    'peg_min', 'peg_max', 'ps_min', 'ps_max', 'pb_min', 'pb_max',
+    'debt_equity_min', 'debt_equity_max', 'roe_min', 'roe_max',
+    'roi_min', 'roi_max', 'roa_min', 'roa_max',
+    'gross_margin_min', 'gross_margin_max',
+    'operating_margin_min', 'operating_margin_max',
+    'net_margin_min', 'net_margin_max',
+    'rsi_min', 'rsi_max', 'beta_min', 'beta_max',
+    'dividend_yield_min', 'dividend_yield_max',
+    'volume_min', 'avg_volume_min', 'relative_volume_min',
+    'price_change_min', 'price_change_max',
+    'performance_week_min', 'performance_month_min',
+    'performance_quarter_min', 'performance_halfyear_min',
+    'performance_year_min', 'performance_ytd_min',
+    'volatility_week_min', 'volatility_month_min',
+    'week52_high_distance_min', 'week52_low_distance_min',
+    'eps_growth_this_year_min', 'eps_growth_next_year_min',
+    'eps_growth_past_5_years_min', 'eps_growth_next_5_years_min',
+    'sales_growth_quarter_min', 'sales_growth_past_5_years_min',
+    'insider_ownership_min', 'insider_ownership_max',
+    'institutional_ownership_min', 'institutional_ownership_max'
+)
+_NUMERIC_TYPES = (int, float)
+
+# セクター名のリストを受け取るパラメータとエラー表示名
+_SECTOR_LIST_PARAMS = (('sectors', 'sector'), ('exclude_sectors', 'exclude_sector'))
+
+# 渡されたパラメータとの共通部分だけを検証するための索引
+_BASIC_SCREENING_PARAM_VALUES = {name: _VALID_PARAMETER_VALUES[key] for name, key in _BASIC_SCREENING_PARAMS}
+_NUMERIC_RANGE_PARAM_NAMES = frozenset(_NUMERIC_RANGE_PARAMS)
+_SCREENING_PARAM_ORDER = {
+    name: i for i, name in enumerate((*_BASIC_SCREENING_PARAM_VALUES, *_NUMERIC_RANGE_PARAMS))
+}
+
+# 平均出来高フィルタの固定パターン
+_VOLUME_FIXED_PATTERNS = frozenset({
+    # Under patterns
+    'u50', 'u100', 'u500', 'u750', 'u1000',
+    # Over patterns
+    'o50', 'o100', 'o200', 'o300', 'o400', 'o500', 'o750', 'o1000', 'o2000',
+    # 既存の範囲パターン（下位互換性）
+    '100to500', '100to1000', '500to1000', '500to10000',
+    # Custom
+    'frange'
+})
+
+# Finviz価格プリセットの接頭辞（o: over, u: under）
+_PRICE_PRESET_PREFIXES = frozenset({'o', 'u'})
+
+# 平均出来高のカスタム範囲パターン（例: 500to2000, 1000to）
+_VOLUME_RANGE_RE = re.compile(r'^\d+to\d*$')
+
+# カスタム範囲を指定できる数値パラメータ
+_CUSTOM_RANGE_PARAMS = frozenset({
+    'price', 'market_cap', 'pe', 'forward_pe', 'peg', 'ps', 'pb',
+    'debt_equity', 'roe', 'roi', 'roa', 'dividend_yield',
+    'volume', 'avg_volume', 'relative_volume', 'rsi', 'beta'
+})
+
+# 追加の有効データフィールド（後方互換性のため）
+_ADDITIONAL_VALID_FIELDS = frozenset({
+    # エラーで報告されたフィールド名の代替名
+    'eps_growth_this_y', 'eps_growth_next_y', 'eps_growth_next_5y',
+    'eps_growth_past_5y', 'sales_growth_qtr', 'eps_growth_qtr',
+    'sales_growth_qoq', 'performance_1w', 'performance_1m',
+    'recommendation', 'analyst_recommendation',
+    'insider_own', 'institutional_own', 'insider_ownership', 'institutional_ownership',
+
+    # エラーで報告された無効フィールド名の正しい代替名
+    'roi',  # roic (Return on Invested Capital) の代替名
+    'debt_equity',  # debt_to_equity の代替名
+    'book_value',  # book_value_per_share の代替名
+    'performance_week',  # performance_1w の代替名
+    'performance_month',  # performance_1m の代替名
+    'short_float',  # float_short の代替名
+
+    # その他の代替フィールド名
+    'profit_margin',  # profit_marginのエイリアス
+    'all',  # 全フィールド取得用の特別キー
+
+    # 実際に取得されているFinvizフィールド名（104フィールド）
+    '200_day_simple_moving_average', '20_day_simple_moving_average', '50_day_high',
+    '50_day_low', '50_day_simple_moving_average', '52_week_high', '52_week_low',
+    'after_hours_change', 'after_hours_close', 'all_time_high', 'all_time_low',
+    'analyst_recom', 'average_true_range', 'average_volume', 'beta', 'book_sh',
+    'cash_sh', 'change', 'change_from_open', 'company', 'country', 'current_ratio',
+    'dividend', 'dividend_yield', 'earnings_date', 'employees', 'eps_growth_next_5_years',
+    'eps_growth_next_year', 'eps_growth_past_5_years', 'eps_growth_quarter_over_quarter',
+    'eps_growth_this_year', 'eps_next_q', 'eps_surprise', 'eps_ttm', 'float_percent',
+    'forward_p_e', 'gap', 'gross_margin', 'high', 'income', 'index', 'industry',
+    'insider_ownership', 'insider_transactions', 'institutional_ownership',
+    'institutional_transactions', 'ipo_date', 'low', 'lt_debt_equity', 'market_cap',
+    'no', 'open', 'operating_margin', 'optionable', 'p_b', 'p_cash', 'p_e',
+    'p_free_cash_flow', 'p_s', 'payout_ratio', 'peg', 'performance_10_minutes',
+    'performance_15_minutes', 'performance_1_hour', 'performance_1_minute',
+    'performance_2_hours', 'performance_2_minutes', 'performance_30_minutes',
+    'performance_3_minutes', 'performance_4_hours', 'performance_5_minutes',
+    'performance_half_year', 'performance_month', 'performance_quarter',
+    'performance_week', 'performance_year', 'performance_ytd', 'prev_close',
+    'price', 'profit_margin', 'quick_ratio', 'relative_strength_index_14',
+    'relative_volume', 'return_on_assets', 'return_on_equity', 'return_on_invested_capital',
+    'revenue_surprise', 'sales', 'sales_growth_past_5_years', 'sales_growth_quarter_over_quarter',
+    'sector', 'shares_float', 'shares_outstanding', 'short_float', 'short_interest',
+    'short_ratio', 'shortable', 'target_price', 'ticker', 'total_debt_equity',
+    'trades', 'volatility_month', 'volatility_week', 'volume'
+})
+
+# constants.pyのFINVIZ_COMPREHENSIVE_FIELD_MAPPINGと追加フィールドを合わせた有効データフィールド
+_VALID_DATA_FIELDS = frozenset(FINVIZ_COMPREHENSIVE_FIELD_MAPPING) | _ADDITIONAL_VALID_FIELDS
 
 def validate_ticker(ticker: str) -> bool:
     """
@@ -12,12 +231,13 @@ def validate_ticker(ticker: str) -> bool:
     Returns:
         有効なティッカーかどうか
     """
-    if not ticker or not isinstance(ticker, str):
-        return False
-    
-    # 基本的なパターンチェック（1-5文字のアルファベット）
-    pattern = r'^[A-Z]{1,5}$'
-    return bool(re.match(pattern, ticker.upper()))
+    # str以外（ハッシュ不可能な値を含む）は無効。1-5文字のASCIIアルファベット
+    # （大文字小文字は問わない）をC実装のstr述語だけで判定
+    return isinstance(ticker, str) and 0 < len(ticker) <= 5 and ticker.isascii() and ticker.isalpha()
+
+def _split_tickers(tickers: str) -> List[str]:
+    """カンマ区切り文字列を空白除去済みの空でない要素に分割"""
+    return [t for t in map(str.strip, tickers.split(',')) if t]
 
 def validate_tickers(tickers: str) -> bool:
     """
@@ -33,13 +253,13 @@ def validate_tickers(tickers: str) -> bool:
         return False
     
     # カンマで分割して各ティッカーを検証
-    ticker_list = [t.strip() for t in tickers.split(',') if t.strip()]
+    ticker_list = _split_tickers(tickers)
     
     if not ticker_list:
         return False
     
     # すべてのティッカーが有効かチェック
-    return all(validate_ticker(ticker) for ticker in ticker_list)
+    return all(map(validate_ticker, ticker_list))
 
 def parse_tickers(tickers: str) -> List[str]:
     """
@@ -54,8 +274,25 @@ def parse_tickers(tickers: str) -> List[str]:
     if not tickers or not isinstance(tickers, str):
         return []
     
-    # カンマで分割して空白を除去し、大文字に変換
-    return [t.strip().upper() for t in tickers.split(',') if t.strip()]
+    # 入力全体を一度だけ大文字に変換してから分割・空白除去
+    return _split_tickers(tickers.upper())
+
+def _price_to_float(value: Optional[Union[int, float, str]]) -> Optional[float]:
+    """価格値を数値に変換（Finviz形式も対応）"""
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        # Finvizプリセット形式の場合（例: 'o5', 'u10'）
+        if value[:1] in _PRICE_PRESET_PREFIXES:
+            value = value[1:]
+        # 数値文字列の場合
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
 
 def validate_price_range(min_price: Optional[Union[int, float, str]], max_price: Optional[Union[int, float, str]]) -> bool:
     """
@@ -68,28 +305,8 @@ def validate_price_range(min_price: Optional[Union[int, float, str]], max_price:
     Returns:
         有効な価格範囲かどうか
     """
-    def _convert_to_float(value):
-        """価格値を数値に変換（Finviz形式も対応）"""
-        if value is None:
-            return None
-        if isinstance(value, (int, float)):
-            return float(value)
-        if isinstance(value, str):
-            # Finvizプリセット形式の場合（例: 'o5', 'u10'）
-            if value.startswith(('o', 'u')):
-                try:
-                    return float(value[1:])
-                except ValueError:
-                    return None
-            # 数値文字列の場合
-            try:
-                return float(value)
-            except ValueError:
-                return None
-        return None
-    
-    min_val = _convert_to_float(min_price)
-    max_val = _convert_to_float(max_price)
+    min_val = _price_to_float(min_price)
+    max_val = _price_to_float(max_price)
     
     if min_val is not None and min_val < 0:
         return False
@@ -112,7 +329,7 @@ def validate_market_cap(market_cap: str) -> bool:
     Returns:
         有効な時価総額フィルタかどうか
     """
-    return market_cap in ALL_PARAMETERS['cap']
+    return market_cap in _VALID_PARAMETER_VALUES['cap']
 
 def validate_earnings_date(earnings_date: str) -> bool:
     """
@@ -124,23 +341,7 @@ def validate_earnings_date(earnings_date: str) -> bool:
     Returns:
         有効な決算発表日フィルタかどうか
     """
-    # APIレベルの有効な決算日値を定義
-    valid_api_values = {
-        'today_after',
-        'today_before', 
-        'tomorrow_after',
-        'tomorrow_before',
-        'yesterday_after',
-        'yesterday_before',
-        'this_week',
-        'next_week',
-        'within_2_weeks',
-        'thisweek',
-        'nextweek',
-        'nextdays5'
-    }
-    
-    return earnings_date in valid_api_values
+    return earnings_date in _VALID_EARNINGS_DATES
 
 def validate_sector(sector: str) -> bool:
     """
@@ -152,35 +353,11 @@ def validate_sector(sector: str) -> bool:
     Returns:
         有効なセクター名かどうか
     """
-    # APIレベルの有効なセクター名を定義
-    valid_api_sectors = {
-        # ユーザーフレンドリーなセクター名
-        'Basic Materials',
-        'Communication Services', 
-        'Consumer Cyclical',
-        'Consumer Defensive',
-        'Energy',
-        'Financial',
-        'Healthcare',
-        'Industrials',
-        'Real Estate',
-        'Technology',
-        'Utilities',
-        # 内部パラメータ値も受け入れ
-        'basicmaterials',
-        'communicationservices',
-        'consumercyclical', 
-        'consumerdefensive',
-        'energy',
-        'financial',
-        'healthcare',
-        'industrials',
-        'realestate',
-        'technology',
-        'utilities'
-    }
-    
-    return sector in valid_api_sectors
+    if not isinstance(sector, str):
+        return False
+    
+    candidates = _VALID_SECTORS_BY_LENGTH.get(len(sector))
+    return candidates is not None and sector in candidates
 
 def validate_percentage(value: float, min_val: float = -100, max_val: float = 1000) -> bool:
     """
@@ -210,168 +387,104 @@ def validate_volume(volume: Union[int, float, str]) -> bool:
         return volume >= 0
     
     if isinstance(volume, str):
-        # 数値文字列のチェックを追加（整数と浮動小数点の両方）
-        try:
-            return float(volume) >= 0
-        except ValueError:
-            pass  # 数値でない場合は下のFinviz形式チェックに進む
-            
-        # Finviz平均出来高形式の検証
+        # Finviz平均出来高形式の検証（例外を伴う数値変換より先に判定）
         
         # Under/Over patterns (固定値)
-        fixed_patterns = {
-            # Under patterns
-            'u50', 'u100', 'u500', 'u750', 'u1000',
-            # Over patterns  
-            'o50', 'o100', 'o200', 'o300', 'o400', 'o500', 'o750', 'o1000', 'o2000',
-            # 既存の範囲パターン（下位互換性）
-            '100to500', '100to1000', '500to1000', '500to10000',
-            # Custom
-            'frange'
-        }
-        
-        if volume in fixed_patterns:
+        if volume in _VOLUME_FIXED_PATTERNS:
             return True
         
         # カスタム範囲パターン（数値to数値）の検証
         # 例: 500to2000, 100to500, 1000to5000
-        import re
-        range_pattern = r'^\d+to\d*$'
-        if re.match(range_pattern, volume):
+        if _VOLUME_RANGE_RE.match(volume) is not None:
             return True
         
-        return False
+        # 数値文字列のチェック（整数と浮動小数点の両方）
+        try:
+            return float(volume) >= 0
+        except ValueError:
+            return False
     
     return False
 
-def validate_screening_params(params: Dict[str, Any]) -> List[str]:
+def _ordered_screening_params(names) -> List[str]:
+    """指定されたパラメータ名を定義順（エラーメッセージの順序）に並べる"""
+    return sorted(names, key=_SCREENING_PARAM_ORDER.__getitem__)
+
+def iter_screening_param_errors(params: Dict[str, Any]) -> Iterator[str]:
     """
-    スクリーニングパラメータの妥当性をチェック（完全版）
+    スクリーニングパラメータのエラーメッセージを順に生成（呼び出し側で途中打ち切り可能）
     
     Args:
         params: スクリーニングパラメータ
         
-    Returns:
-        エラーメッセージのリスト（空の場合は全て有効）
+    Yields:
+        エラーメッセージ
     """
-    errors = []
+    # 空、または全て未指定（None）のパラメータには検証対象がない
+    if all(value is None for value in params.values()):
+        return
     
     # 基本パラメータの検証
-    basic_params = {
-        'exchange': 'exch',
-        'index': 'idx', 
-        'sector': 'sec',
-        'industry': 'ind',
-        'country': 'geo',
-        'market_cap': 'cap',
-        'price': 'sh_price',
-        'target_price': 'targetprice',
-        'dividend_yield': 'fa_div',
-        'short_float': 'sh_short',
-        'analyst_recommendation': 'an_recom',
-        'option_short': 'sh_opt',
-        'earnings_date': 'earningsdate',
-        'ipo_date': 'ipodate',
-        'average_volume': 'sh_avgvol',
-        'relative_volume': 'sh_relvol',
-        'current_volume': 'sh_curvol',
-        'trades': 'sh_trades',
-        'shares_outstanding': 'sh_outstanding',
-        'float': 'sh_float'
-    }
-    
-    for param_name, param_key in basic_params.items():
-        if param_name in params and params[param_name] is not None:
-            if params[param_name] not in ALL_PARAMETERS[param_key]:
-                errors.append(f"Invalid {param_name}: {params[param_name]}")
+    for param_name in _ordered_screening_params(params.keys() & _BASIC_SCREENING_PARAM_VALUES.keys()):
+        value = params[param_name]
+        if value is not None and value not in _BASIC_SCREENING_PARAM_VALUES[param_name]:
+            yield f"Invalid {param_name}: {value}"
     
     # 価格範囲チェック
     min_price = params.get('min_price')
     max_price = params.get('max_price')
     if not validate_price_range(min_price, max_price):
-        errors.append("Invalid price range")
-    
-    # 数値範囲チェック
-    numeric_range_params = [
-        'pe_min', 'pe_max', 'forward_pe_min', 'forward_pe_max',
-        'peg_min', 'peg_max', 'ps_min', 'ps_max', 'pb_min', 'pb_max',
-        'debt_equity_min', 'debt_equity_max', 'roe_min', 'roe_max',
-        'roi_min', 'roi_max', 'roa_min', 'roa_max',
-        'gross_margin_min', 'gross_margin_max',
-        'operating_margin_min', 'operating_margin_max',
-        'net_margin_min', 'net_margin_max',
-        'rsi_min', 'rsi_max', 'beta_min', 'beta_max',
-        'dividend_yield_min', 'dividend_yield_max',
-        'volume_min', 'avg_volume_min', 'relative_volume_min',
-        'price_change_min', 'price_change_max',
-        'performance_week_min', 'performance_month_min',
-        'performance_quarter_min', 'performance_halfyear_min',
-        'performance_year_min', 'performance_ytd_min',
-        'volatility_week_min', 'volatility_month_min',
-        'week52_high_distance_min', 'week52_low_distance_min',
-        'eps_growth_this_year_min', 'eps_growth_next_year_min',
-        'eps_growth_past_5_years_min', 'eps_growth_next_5_years_min',
-        'sales_growth_quarter_min', 'sales_growth_past_5_years_min',
-        'insider_ownership_min', 'insider_ownership_max',
-        'institutional_ownership_min', 'institutional_ownership_max'
-    ]
-    
-    for param in numeric_range_params:
-        if param in params and params[param] is not None:
-            if not isinstance(params[param], (int, float)):
-                errors.append(f"Invalid {param}: must be numeric")
-    
-    # 複数セクターチェック
-    if 'sectors' in params and params['sectors']:
-        for sector in params['sectors']:
-            if not validate_sector(sector):
-                errors.append(f"Invalid sector: {sector}")
-    
-    # 除外セクターチェック
-    if 'exclude_sectors' in params and params['exclude_sectors']:
-        for sector in params['exclude_sectors']:
-            if not validate_sector(sector):
-                errors.append(f"Invalid exclude_sector: {sector}")
+        yield "Invalid price range"
+    
+    # 数値範囲チェック（boolは数値として扱わない）
+    for param in _ordered_screening_params(params.keys() & _NUMERIC_RANGE_PARAM_NAMES):
+        value = params[param]
+        if value is not None and (not isinstance(value, _NUMERIC_TYPES) or isinstance(value, bool)):
+            yield f"Invalid {param}: must be numeric"
+    
+    # 複数セクター・除外セクターチェック
+    for list_param, label in _SECTOR_LIST_PARAMS:
+        for sector in params.get(list_param) or ():
+            if sector not in _VALID_SECTORS:
+                yield f"Invalid {label}: {sector}"
     
     # SMAフィルタチェック
-    if 'sma_filter' in params and params['sma_filter'] is not None:
-        valid_sma_filters = ['above_sma20', 'above_sma50', 'above_sma200', 
-                            'below_sma20', 'below_sma50', 'below_sma200', 'none']
-        if params['sma_filter'] not in valid_sma_filters:
-            errors.append(f"Invalid sma_filter: {params['sma_filter']}")
+    sma_filter = params.get('sma_filter')
+    if sma_filter is not None and sma_filter not in _VALID_SMA_FILTERS:
+        yield f"Invalid sma_filter: {sma_filter}"
     
     # ソート基準チェック
-    if 'sort_by' in params and params['sort_by'] is not None:
-        valid_sort_options = [
-            'ticker', 'company', 'sector', 'industry', 'country',
-            'market_cap', 'pe', 'price', 'change', 'volume',
-            'price_change', 'relative_volume', 'performance_week',
-            'performance_month', 'performance_quarter', 'performance_year',
-            'analyst_recom', 'avg_volume', 'dividend_yield',
-            'eps', 'sales', 'float', 'insider_own', 'inst_own',
-            'rsi', 'volatility', 'earnings_date', 'ipo_date'
-        ]
-        if params['sort_by'] not in valid_sort_options:
-            errors.append(f"Invalid sort_by: {params['sort_by']}")
+    sort_by = params.get('sort_by')
+    if sort_by is not None and sort_by not in _VALID_SORT_OPTIONS:
+        yield f"Invalid sort_by: {sort_by}"
     
     # ソート順序チェック
-    if 'sort_order' in params and params['sort_order'] is not None:
-        if params['sort_order'] not in ['asc', 'desc']:
-            errors.append(f"Invalid sort_order: {params['sort_order']}")
+    sort_order = params.get('sort_order')
+    if sort_order is not None and sort_order not in _VALID_SORT_ORDERS:
+        yield f"Invalid sort_order: {sort_order}"
     
     # 最大結果数チェック
-    if 'max_results' in params and params['max_results'] is not None:
-        max_results = params['max_results']
+    max_results = params.get('max_results')
+    if max_results is not None:
         if not isinstance(max_results, int) or max_results <= 0 or max_results > 10000:
-            errors.append(f"Invalid max_results: {max_results} (must be 1-10000)")
+            yield f"Invalid max_results: {max_results} (must be 1-10000)"
     
     # ビューチェック
-    if 'view' in params and params['view'] is not None:
-        valid_views = ['111', '121', '131', '141', '151', '161', '171']
-        if params['view'] not in valid_views:
-            errors.append(f"Invalid view: {params['view']}")
+    view = params.get('view')
+    if view is not None and view not in _VALID_VIEWS:
+        yield f"Invalid view: {view}"
+
+def validate_screening_params(params: Dict[str, Any]) -> List[str]:
+    """
+    スクリーニングパラメータの妥当性をチェック（完全版）
     
-    return errors
+    Args:
+        params: スクリーニングパラメータ
+        
+    Returns:
+        エラーメッセージのリスト（空の場合は全て有効）
+    """
+    return list(iter_screening_param_errors(params))
 
 def validate_data_fields(fields: List[str]) -> List[str]:
     """
@@ -383,69 +496,7 @@ def validate_data_fields(fields: List[str]) -> List[str]:
     Returns:
         無効なフィールドのリスト
     """
-    # constants.pyのFINVIZ_COMPREHENSIVE_FIELD_MAPPINGから動的に有効フィールドを取得
-    try:
-        from ..constants import FINVIZ_COMPREHENSIVE_FIELD_MAPPING
-    except ImportError:
-        # 直接実行時の場合
-        import sys
-        import os
-        sys.path.append(os.path.dirname(os.path.dirname(__file__)))
-        from constants import FINVIZ_COMPREHENSIVE_FIELD_MAPPING
-    
-    valid_fields = set(FINVIZ_COMPREHENSIVE_FIELD_MAPPING.keys())
-    
-    # 追加の有効フィールド（後方互換性のため）
-    additional_valid_fields = {
-        # エラーで報告されたフィールド名の代替名
-        'eps_growth_this_y', 'eps_growth_next_y', 'eps_growth_next_5y',
-        'eps_growth_past_5y', 'sales_growth_qtr', 'eps_growth_qtr', 
-        'sales_growth_qoq', 'performance_1w', 'performance_1m',
-        'recommendation', 'analyst_recommendation',
-        'insider_own', 'institutional_own', 'insider_ownership', 'institutional_ownership',
-        
-        # エラーで報告された無効フィールド名の正しい代替名
-        'roi',  # roic (Return on Invested Capital) の代替名
-        'debt_equity',  # debt_to_equity の代替名
-        'book_value',  # book_value_per_share の代替名
-        'performance_week',  # performance_1w の代替名
-        'performance_month',  # performance_1m の代替名
-        'short_float',  # float_short の代替名
-        
-        # その他の代替フィールド名
-        'profit_margin',  # profit_marginのエイリアス
-        'all',  # 全フィールド取得用の特別キー
-        
-        # 実際に取得されているFinvizフィールド名（104フィールド）
-        '200_day_simple_moving_average', '20_day_simple_moving_average', '50_day_high', 
-        '50_day_low', '50_day_simple_moving_average', '52_week_high', '52_week_low', 
-        'after_hours_change', 'after_hours_close', 'all_time_high', 'all_time_low', 
-        'analyst_recom', 'average_true_range', 'average_volume', 'beta', 'book_sh', 
-        'cash_sh', 'change', 'change_from_open', 'company', 'country', 'current_ratio', 
-        'dividend', 'dividend_yield', 'earnings_date', 'employees', 'eps_growth_next_5_years', 
-        'eps_growth_next_year', 'eps_growth_past_5_years', 'eps_growth_quarter_over_quarter', 
-        'eps_growth_this_year', 'eps_next_q', 'eps_surprise', 'eps_ttm', 'float_percent', 
-        'forward_p_e', 'gap', 'gross_margin', 'high', 'income', 'index', 'industry', 
-        'insider_ownership', 'insider_transactions', 'institutional_ownership', 
-        'institutional_transactions', 'ipo_date', 'low', 'lt_debt_equity', 'market_cap', 
-        'no', 'open', 'operating_margin', 'optionable', 'p_b', 'p_cash', 'p_e', 
-        'p_free_cash_flow', 'p_s', 'payout_ratio', 'peg', 'performance_10_minutes', 
-        'performance_15_minutes', 'performance_1_hour', 'performance_1_minute', 
-        'performance_2_hours', 'performance_2_minutes', 'performance_30_minutes', 
-        'performance_3_minutes', 'performance_4_hours', 'performance_5_minutes', 
-        'performance_half_year', 'performance_month', 'performance_quarter', 
-        'performance_week', 'performance_year', 'performance_ytd', 'prev_close', 
-        'price', 'profit_margin', 'quick_ratio', 'relative_strength_index_14', 
-        'relative_volume', 'return_on_assets', 'return_on_equity', 'return_on_invested_capital', 
-        'revenue_surprise', 'sales', 'sales_growth_past_5_years', 'sales_growth_quarter_over_quarter', 
-        'sector', 'shares_float', 'shares_outstanding', 'short_float', 'short_interest', 
-        'short_ratio', 'shortable', 'target_price', 'ticker', 'total_debt_equity', 
-        'trades', 'volatility_month', 'volatility_week', 'volume'
-    }
-    
-    valid_fields.update(additional_valid_fields)
-    
-    return [field for field in fields if field not in valid_fields]
+    return [field for field in fields if field not in _VALID_DATA_FIELDS]
 
 def validate_exchange(exchange: str) -> bool:
     """
@@ -457,7 +508,7 @@ def validate_exchange(exchange: str) -> bool:
     Returns:
         有効な取引所コードかどうか
     """
-    return exchange in ALL_PARAMETERS['exch']
+    return exchange in _VALID_PARAMETER_VALUES['exch']
 
 def validate_index(index: str) -> bool:
     """
@@ -469,7 +520,7 @@ def validate_index(index: str) -> bool:
     Returns:
         有効な指数コードかどうか
     """
-    return index in ALL_PARAMETERS['idx']
+    return index in _VALID_PARAMETER_VALUES['idx']
 
 def validate_industry(industry: str) -> bool:
     """
@@ -481,7 +532,7 @@ def validate_industry(industry: str) -> bool:
     Returns:
         有効な業界コードかどうか
     """
-    return industry in ALL_PARAMETERS['ind']
+    return industry in _VALID_PARAMETER_VALUES['ind']
 
 def validate_country(country: str) -> bool:
     """
@@ -493,7 +544,7 @@ def validate_country(country: str) -> bool:
     Returns:
         有効な国コードかどうか
     """
-    return country in ALL_PARAMETERS['geo']
+    return country in _VALID_PARAMETER_VALUES['geo']
 
 def validate_price_filter(price: str) -> bool:
     """
@@ -505,7 +556,7 @@ def validate_price_filter(price: str) -> bool:
     Returns:
         有効な価格フィルタかどうか
     """
-    return price in ALL_PARAMETERS['sh_price']
+    return price in _VALID_PARAMETER_VALUES['sh_price']
 
 def validate_target_price(target_price: str) -> bool:
     """
@@ -517,7 +568,7 @@ def validate_target_price(target_price: str) -> bool:
     Returns:
         有効な目標価格フィルタかどうか
     """
-    return target_price in ALL_PARAMETERS['targetprice']
+    return target_price in _VALID_PARAMETER_VALUES['targetprice']
 
 def validate_dividend_yield_filter(dividend_yield: str) -> bool:
     """
@@ -529,7 +580,7 @@ def validate_dividend_yield_filter(dividend_yield: str) -> bool:
     Returns:
         有効な配当利回りフィルタかどうか
     """
-    return dividend_yield in ALL_PARAMETERS['fa_div']
+    return dividend_yield in _VALID_PARAMETER_VALUES['fa_div']
 
 def validate_short_float(short_float: str) -> bool:
     """
@@ -541,7 +592,7 @@ def validate_short_float(short_float: str) -> bool:
     Returns:
         有効なショート比率フィルタかどうか
     """
-    return short_float in ALL_PARAMETERS['sh_short']
+    return short_float in _VALID_PARAMETER_VALUES['sh_short']
 
 def validate_analyst_recommendation(analyst_rec: str) -> bool:
     """
@@ -553,7 +604,7 @@ def validate_analyst_recommendation(analyst_rec: str) -> bool:
     Returns:
         有効なアナリスト推奨フィルタかどうか
     """
-    return analyst_rec in ALL_PARAMETERS['an_recom']
+    return analyst_rec in _VALID_PARAMETER_VALUES['an_recom']
 
 def validate_option_short(option_short: str) -> bool:
     """
@@ -565,7 +616,7 @@ def validate_option_short(option_short: str) -> bool:
     Returns:
         有効なオプション/ショートフィルタかどうか
     """
-    return option_short in ALL_PARAMETERS['sh_opt']
+    return option_short in _VALID_PARAMETER_VALUES['sh_opt']
 
 def validate_ipo_date(ipo_date: str) -> bool:
     """
@@ -577,7 +628,7 @@ def validate_ipo_date(ipo_date: str) -> bool:
     Returns:
         有効なIPO日フィルタかどうか
     """
-    return ipo_date in ALL_PARAMETERS['ipodate']
+    return ipo_date in _VALID_PARAMETER_VALUES['ipodate']
 
 def validate_volume_filter(volume_type: str, volume_filter: str) -> bool:
     """
@@ -590,9 +641,8 @@ def validate_volume_filter(volume_type: str, volume_filter: str) -> bool:
     Returns:
         有効な出来高フィルタかどうか
     """
-    if volume_type in ALL_PARAMETERS:
-        return volume_filter in ALL_PARAMETERS[volume_type]
-    return False
+    valid_values = _VALID_PARAMETER_VALUES.get(volume_type)
+    return valid_values is not None and volume_filter in valid_values
 
 def validate_shares_filter(shares_type: str, shares_filter: str) -> bool:
     """
@@ -605,9 +655,8 @@ def validate_shares_filter(shares_type: str, shares_filter: str) -> bool:
     Returns:
         有効な株式数フィルタかどうか
     """
-    if shares_type in ALL_PARAMETERS:
-        return shares_filter in ALL_PARAMETERS[shares_type]
-    return False
+    valid_values = _VALID_PARAMETER_VALUES.get(shares_type)
+    return valid_values is not None and shares_filter in valid_values
 
 def validate_custom_range(param_name: str, min_val: Optional[float], max_val: Optional[float]) -> bool:
     """
@@ -622,13 +671,7 @@ def validate_custom_range(param_name: str, min_val: Optional[float], max_val: Op
         有効なカスタム範囲かどうか
     """
     # 数値パラメータの場合のみ検証
-    numeric_params = {
-        'price', 'market_cap', 'pe', 'forward_pe', 'peg', 'ps', 'pb',
-        'debt_equity', 'roe', 'roi', 'roa', 'dividend_yield',
-        'volume', 'avg_volume', 'relative_volume', 'rsi', 'beta'
-    }
-    
-    if param_name not in numeric_params:
+    if param_name not in _CUSTOM_RANGE_PARAMS:
         return False
     
     if min_val is not None and max_val is not None:
@@ -636,14 +679,29 @@ def validate_custom_range(param_name: str, min_val: Optional[float], max_val: Op
     
     return True
 
-def get_all_valid_values() -> Dict[str, List[str]]:
+def get_all_valid_values() -> Mapping[str, Tuple[str, ...]]:
     """
     すべての有効なパラメータ値を取得
     
     Returns:
-        パラメータ名と有効値の辞書
+        パラメータ名と有効値の読み取り専用マッピング（インポート時に一度だけ構築）
     """
-    return {param: list(values.keys()) for param, values in ALL_PARAMETERS.items()}
+    return _ALL_VALID_VALUES
+
+# 同時に指定できないフィルタの組み合わせ
+_PRICE_FILTER_PARAMS = ('price', 'price_min', 'price_max')
+_VOLUME_FILTER_PARAMS = ('average_volume', 'avg_volume_min', 'volume_min')
+_RELATIVE_VOLUME_FILTER_PARAMS = ('relative_volume', 'relative_volume_min')
+
+def _has_multiple_values(params: Dict[str, Any], names: tuple) -> bool:
+    """指定パラメータのうち2つ以上に値が設定されているか（2つ目で打ち切り）"""
+    found = False
+    for name in names:
+        if params.get(name) is not None:
+            if found:
+                return True
+            found = True
+    return False
 
 def validate_parameter_combination(params: Dict[str, Any]) -> List[str]:
     """
@@ -662,25 +720,33 @@ def validate_parameter_combination(params: Dict[str, Any]) -> List[str]:
         errors.append("Cannot exclude and include ETFs simultaneously")
     
     # 価格範囲の組み合わせチェック
-    price_filters = ['price', 'price_min', 'price_max']
-    price_count = sum(1 for p in price_filters if p in params and params[p] is not None)
-    if price_count > 1:
+    if _has_multiple_values(params, _PRICE_FILTER_PARAMS):
         errors.append("Use either price filter OR price_min/max, not both")
     
     # 出来高範囲の組み合わせチェック
-    volume_filters = ['average_volume', 'avg_volume_min', 'volume_min']
-    volume_count = sum(1 for v in volume_filters if v in params and params[v] is not None)
-    if volume_count > 1:
+    if _has_multiple_values(params, _VOLUME_FILTER_PARAMS):
         errors.append("Use either volume filter OR volume_min, not both")
     
     # 相対出来高範囲の組み合わせチェック
-    rel_volume_filters = ['relative_volume', 'relative_volume_min']
-    rel_volume_count = sum(1 for rv in rel_volume_filters if rv in params and params[rv] is not None)
-    if rel_volume_count > 1:
+    if _has_multiple_values(params, _RELATIVE_VOLUME_FILTER_PARAMS):
         errors.append("Use either relative_volume filter OR relative_volume_min, not both")
     
     return errors
 
+def validate_all_params(params: Dict[str, Any]) -> List[str]:
+    """
+    スクリーニングパラメータの値と組み合わせをまとめてチェック
+    
+    Args:
+        params: スクリーニングパラメータ
+        
+    Returns:
+        エラーメッセージのリスト（値のエラー、組み合わせエラーの順）
+    """
+    errors = validate_screening_params(params)
+    errors.extend(validate_parameter_combination(params))
+    return errors
+
 def sanitize_input(value: Any) -> Any:
     """
     入力値をサニタイズ
@@ -693,9 +759,8 @@ def sanitize_input(value: Any) -> Any:
     """
     if isinstance(value, str):
         # SQLインジェクションやXSS攻撃を防ぐための基本的なサニタイゼーション
-        dangerous_chars = ['<', '>', '"', "'", '&', ';', '(', ')', '|', '`']
-        for char in dangerous_chars:
-            value = value.replace(char, '')
-        return value.strip()
+        if _DANGEROUS_CHARS_RE.search(value) is None:
+            return value.strip()
+        return value.translate(_SANITIZE_TABLE).strip()
     
     return value
\ No newline at end of file
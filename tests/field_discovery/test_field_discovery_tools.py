@@ -190,7 +190,18 @@ class TestDescribeField:
         assert "not found" in content.lower() or "invalid" in content.lower()
         # Should suggest similar fields
         assert "similar" in content.lower() or "suggestions" in content.lower()
-    
+
+    def test_handles_very_long_invalid_field(self):
+        """Long unknown names should still report the field names they contain"""
+        long_name = "x" * 20000 + "pe_ratio" + "y" * 20000
+        content = describe_field(long_name)[0].text
+        validation = validate_fields([long_name])[0].text
+
+        assert "not found" in content
+        assert "  • pe_ratio" in content
+        assert "INVALID FIELDS (1)" in validation
+        assert "    → Did you mean: pe_ratio" in validation
+
     def test_provides_usage_examples(self):
         """Should provide practical usage examples"""
         result = describe_field("pe_ratio")
@@ -273,6 +284,15 @@ class TestSearchFields:
         # Should indicate category filter was applied
         assert "valuation" in content.lower()
 
+    def test_repeated_search_returns_fresh_list(self):
+        """Repeated searches should return equal text in independent lists"""
+        first = search_fields("ratio", category="valuation")
+        second = search_fields("ratio", category="valuation")
+
+        assert first is not second
+        assert first[0].text == second[0].text
+        assert search_fields("ratio")[0].text != first[0].text
+
 
 class TestValidateFields:
     """Test the validate_fields MCP tool"""
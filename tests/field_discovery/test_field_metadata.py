@@ -247,6 +247,10 @@ class TestFieldSearchEngine:
         fundamental_results = engine.search("ratio", category="fundamental")
         assert len(fundamental_results) == 1
         assert fundamental_results[0].name == "current_ratio"
+
+        # Category filter is case-insensitive; unknown categories match nothing
+        assert [r.name for r in engine.search("ratio", category="Valuation")] == ["pe_ratio"]
+        assert engine.search("ratio", category="technical") == []
     
     def test_search_no_results(self):
         """Should handle searches with no results"""
@@ -292,6 +296,19 @@ class TestFieldSearchEngine:
         growth_in_name = [name for name in result_names if "growth" in name]
         assert len(growth_in_name) >= 2
 
+    def test_search_matches_substrings_by_field(self):
+        """Name matches should outrank display and description matches"""
+        fields = {
+            "rsi": FieldMetadata("rsi", "RSI", "technical", "Relative strength (momentum)", "float"),
+            "momentum_score": FieldMetadata("momentum_score", "Score", "technical", "Composite", "float"),
+            "trend": FieldMetadata("trend", "Momentum Trend", "technical", "Direction", "string")
+        }
+
+        engine = FieldSearchEngine(fields)
+
+        assert [r.name for r in engine.search("MENTUM")] == ["momentum_score", "trend", "rsi"]
+        assert [r.name for r in engine.search("ment", category="TECHNICAL")] == ["momentum_score", "trend", "rsi"]
+
 
 class TestFieldValidator:
     """Test the FieldValidator class"""
@@ -369,6 +386,21 @@ class TestFieldValidator:
         # Very different field name should get no suggestions
         suggestions = validator.suggest_corrections(["completely_different_field_name"])
         assert len(suggestions["completely_different_field_name"]) == 0
+
+    def test_repeated_suggestions_follow_valid_field_changes(self):
+        """Repeated typos should give the same result until valid_fields changes"""
+        valid_fields = {"ticker", "company"}
+        validator = FieldValidator(valid_fields)
+
+        first = validator.suggest_corrections(["sectr"])
+        assert first == validator.suggest_corrections(["sectr"]) == {"sectr": []}
+
+        # Returned lists are independent of the memo
+        first["sectr"].append("ticker")
+        assert validator.suggest_corrections(["sectr"]) == {"sectr": []}
+
+        valid_fields.add("sector")
+        assert validator.suggest_corrections(["sectr"]) == {"sectr": ["sector"]}
     
     def test_empty_field_list(self):
         """Should handle empty field list"""
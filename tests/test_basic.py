@@ -32,7 +32,7 @@ def test_imports():
 
 def test_validators():
     """Test validation functions"""
-    from src.utils.validators import validate_ticker, validate_market_cap, validate_price_range
+    from src.utils.validators import validate_ticker, validate_market_cap, validate_price_range, sanitize_input, validate_screening_params, validate_data_fields, validate_all_params, iter_screening_param_errors
     
     # Test ticker validation
     assert validate_ticker("AAPL") == True
@@ -40,6 +40,11 @@ def test_validators():
     assert validate_ticker("invalid") == False  # lowercase
     assert validate_ticker("TOOLONG") == False  # too long
     assert validate_ticker("") == False  # empty
+    assert validate_ticker("ÄPPL") == False  # non-ASCII letter
+    assert validate_ticker("AAPL\n") == False  # trailing newline
+    assert validate_ticker("ıBM") == False  # non-ASCII letter that upper-cases to ASCII
+    assert validate_ticker(["A"]) == False  # unhashable non-string
+    assert validate_ticker(None) == False
     
     # Test market cap validation
     assert validate_market_cap("large") == True
@@ -50,6 +55,29 @@ def test_validators():
     assert validate_price_range(100, 10) == False  # min > max
     assert validate_price_range(-10, 100) == False  # negative min
     
+    # Test screening params validation (errors follow the parameter table order)
+    assert validate_screening_params({'pe_max': 'x', 'exchange': 'zz', 'pe_min': 'y', 'market_cap': None}) == [
+        "Invalid exchange: zz",
+        "Invalid pe_min: must be numeric",
+        "Invalid pe_max: must be numeric",
+    ]
+    assert validate_screening_params({'market_cap': 'large', 'pe_min': 10}) == []
+    assert validate_screening_params({'pe_min': True}) == ["Invalid pe_min: must be numeric"]
+    assert next(iter_screening_param_errors({'view': '999', 'exchange': 'zz'})) == "Invalid exchange: zz"
+    assert next(iter_screening_param_errors({'exchange': 'nasd'}), None) is None
+    assert validate_all_params({'exchange': 'zz', 'price': 'o5', 'price_min': 5}) == [
+        "Invalid exchange: zz",
+        "Use either price filter OR price_min/max, not both",
+    ]
+    
+    # Test data field validation (constants mapping plus alias fields)
+    assert validate_data_fields(['ticker', 'price', 'all', 'roi', 'not_a_field']) == ['not_a_field']
+    
+    # Test input sanitization
+    assert sanitize_input(" <b>AAPL</b>; ") == "bAAPL/b"
+    assert sanitize_input("<>\"'&;()|`") == ""
+    assert sanitize_input(42) == 42
+    
     print("✓ Validators working correctly")
     return True
 
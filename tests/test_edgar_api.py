@@ -2,8 +2,10 @@
 Test script for EDGAR API Client functionality
 """
 
+import json
 import sys
 import os
+from unittest.mock import MagicMock, patch
 
 # Add project root to Python path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -117,6 +119,161 @@ def test_company_concept():
         print(f"   ❌ Error testing company concept: {e}")
 
 
+def test_cik_lookup_uses_cached_ticker_map():
+    """Ticker -> CIK map is fetched once and reused across lookups"""
+    client = EdgarAPIClient(cache_dir="")
+    response = MagicMock()
+    response.content = json.dumps({
+        "0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."},
+        "1": {"cik_str": 789019, "ticker": "MSFT", "title": "Microsoft Corp"},
+    }).encode('utf-8')
+    
+    with patch.object(client.session, 'get', return_value=response) as mock_get:
+        assert client._get_cik_from_ticker('AAPL') == '0000320193'
+        assert client._get_cik_from_ticker('msft') == '0000789019'
+        assert client._get_cik_from_ticker('ZZZZ') is None
+    
+    assert mock_get.call_count == 1
+
+
+def test_ticker_map_loaded_once_across_threads():
+    """Concurrent CIK lookups with a cold cache download the ticker map once"""
+    import threading
+    import time
+
+    client = EdgarAPIClient(cache_dir="")
+    response = MagicMock()
+    response.content = json.dumps({
+        "0": {"cik_str": 320193, "ticker": "AAPL", "title": "Apple Inc."},
+    }).encode('utf-8')
+
+    def slow_get(*args, **kwargs):
+        time.sleep(0.05)
+        return response
+
+    with patch.object(client.session, 'get', side_effect=slow_get) as mock_get:
+        threads = [
+            threading.Thread(target=client._get_cik_from_ticker, args=('AAPL',))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert mock_get.call_count == 1
+
+
+def test_company_facts_cached_per_cik():
+    """Company facts are served from the in-process cache on repeat calls"""
+    client = EdgarAPIClient(cache_dir="")
+    facts = {"cik": 320193, "entityName": "Apple Inc.", "facts": {}}
+    
+    with patch.object(client.client, 'get_company_facts', return_value=facts) as mock_facts:
+        assert client.get_company_facts('0000320193') is facts
+        assert client.get_company_facts('0000320193') is facts
+    
+    assert mock_facts.call_count == 1
+
+
+def test_empty_company_facts_not_cached():
+    """A failed (empty) company facts response is retried on the next call"""
+    client = EdgarAPIClient(cache_dir="")
+    facts = {"cik": 320193, "entityName": "Apple Inc.", "facts": {}}
+
+    with patch.object(client.client, 'get_company_facts', side_effect=[None, facts]) as mock_facts:
+        assert client.get_company_facts('0000320193') is None
+        assert client.get_company_facts('0000320193') is facts
+
+    assert mock_facts.call_count == 2
+
+
+def test_company_facts_cache_prunes_expired_and_caps_size():
+    """Expired entries are dropped on insert and the cache never exceeds its cap"""
+    from src.finviz_client import edgar_client
+
+    client = EdgarAPIClient(cache_dir="")
+    with patch.object(client.client, 'get_company_facts', side_effect=lambda cik: {"cik": cik}):
+        client.get_company_facts('stale')
+        client._company_facts_cache['stale'] = (
+            client._company_facts_cache['stale'][0] - edgar_client.COMPANY_FACTS_CACHE_TTL, {"cik": "stale"}
+        )
+        for i in range(edgar_client.COMPANY_FACTS_CACHE_MAXSIZE + 5):
+            client.get_company_facts(f'{i:010d}')
+
+    cache = client._company_facts_cache
+    assert 'stale' not in cache
+    assert len(cache) == edgar_client.COMPANY_FACTS_CACHE_MAXSIZE
+    assert f'{edgar_client.COMPANY_FACTS_CACHE_MAXSIZE + 4:010d}' in cache
+    assert '0000000000' not in cache
+
+
+def test_disk_cache_survives_new_client(tmp_path):
+    """EDGAR JSON responses are reused from disk by a fresh client instance"""
+    concept = {"cik": 320193, "entityName": "Apple Inc.", "units": {"USD": []}}
+    
+    first = EdgarAPIClient(cache_dir=str(tmp_path))
+    with patch.object(first, '_get_cik_from_ticker', return_value='0000320193'), \
+         patch.object(first.client, 'get_company_concept', return_value=concept) as mock_concept:
+        assert first.get_company_concept('AAPL', 'Assets') == concept
+    assert mock_concept.call_count == 1
+    
+    second = EdgarAPIClient(cache_dir=str(tmp_path))
+    with patch.object(second, '_get_cik_from_ticker', return_value='0000320193'), \
+         patch.object(second.client, 'get_company_concept') as mock_concept:
+        assert second.get_company_concept('AAPL', 'Assets') == concept
+    mock_concept.assert_not_called()
+
+
+def test_disk_cache_is_opt_in(monkeypatch, tmp_path):
+    """The disk cache is off by default and enabled through EDGAR_CACHE_DIR"""
+    monkeypatch.delenv('EDGAR_CACHE_DIR', raising=False)
+    assert EdgarAPIClient().cache_dir is None
+
+    monkeypatch.setenv('EDGAR_CACHE_DIR', str(tmp_path))
+    assert EdgarAPIClient().cache_dir == tmp_path
+
+
+def test_company_filings_filter_by_form_and_date():
+    """Form type and date filters select matching rows from the recent filings"""
+    client = EdgarAPIClient(cache_dir="")
+    submissions = {"filings": {"recent": {
+        "form": ["10-Q", "8-K", "10-K", "10-Q"],
+        "filingDate": ["2024-08-02", "2024-07-01", "2023-11-03", "2023-08-04"],
+        "accessionNumber": ["a-1", "a-2", "a-3", "a-4"],
+        "primaryDocument": ["q.htm", "k8.htm", "k.htm", "q2.htm"],
+    }}}
+    
+    with patch.object(client, '_get_cik_from_ticker', return_value='0000320193'), \
+         patch.object(client.client, 'get_submissions', return_value=submissions):
+        filings = client.get_company_filings('AAPL', form_types=['10-K', '10-Q'], date_from='2023-09-01')
+    
+    assert [f['accession_number'] for f in filings] == ['a-1', 'a-3']
+    assert filings[0]['report_date'] == ''
+
+
+def test_multiple_filing_contents_preserve_order():
+    """Concurrent document fetches return results in input order"""
+    client = EdgarAPIClient(cache_dir="")
+    
+    def fake_content(ticker, accession_number, primary_document, max_length):
+        return {'content': accession_number, 'metadata': {}, 'status': 'success'}
+    
+    filings = [
+        {'ticker': 'AAPL', 'accession_number': f'0000320193-24-00000{i}', 'primary_document': 'doc.htm'}
+        for i in range(5)
+    ]
+    filings.insert(2, {'ticker': 'AAPL', 'accession_number': '', 'primary_document': 'doc.htm'})
+    
+    with patch.object(client, 'get_filing_document_content', side_effect=fake_content):
+        results = client.get_multiple_filing_contents(filings)
+    
+    assert [r['content'] for r in results if r['status'] == 'success'] == [
+        f'0000320193-24-00000{i}' for i in range(5)
+    ]
+    assert results[2]['status'] == 'error'
+
+
 if __name__ == "__main__":
     test_edgar_client_basic()
     test_company_concept() 
\ No newline at end of file